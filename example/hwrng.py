@@ -13,18 +13,46 @@ This example shows:
 9. Entropy source selection and customization
 10. Using different hash algorithms and expansion methods
 """
+import atexit
 import base64
 import hashlib
+import io
+import math
 import os
 import secrets
+import sys
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
+import traceback
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import lru_cache, partial
 
 from pyCTools.hwrng import (
     MaxRNG, HashAlgorithm, ExpansionMode, OutputMode,
     SecurityMode
 )
 
+# One persistent pool shared by every demo, so thread start-up is paid once and not per batch
+_POOL = ThreadPoolExecutor(max_workers=min(64, (os.cpu_count() or 8) * 4))
+atexit.register(_POOL.shutdown)
+
+# Result of one threaded worker: a tuple subclass, so no per-result dict is built
+WorkerResult = namedtuple("WorkerResult", ["thread_id", "data", "size", "time", "success", "error"],
+                          defaults=[None, None, None, False, None])
+
+# Shared MaxRNG instance, created on first use so the DLL is loaded and threading set up only once
+_RNG = None
+
+
+def get_rng() -> MaxRNG:
+    """Return the shared MaxRNG instance, creating it and initializing threading on first use."""
+    global _RNG
+    if _RNG is None:
+        _RNG = MaxRNG()
+        _RNG.init_threading()
+    return _RNG
+
 
 def print_separator(title: str = None) -> None:
     """Print a separator with an optional title."""
@@ -34,23 +62,141 @@ def print_separator(title: str = None) -> None:
         print("=" * 80)
 
 
+# Translation table mapping every byte to itself if printable ASCII, otherwise to '.', built once at import
+_ASCII_TBL = bytes.maketrans(bytes(range(256)), bytes((b if 32 <= b <= 126 else 0x2E) for b in range(256)))
+
+
 def hex_format(data: bytes, bytes_per_line: int = 16) -> str:
-    """Format bytes as a nicely formatted hex dump with ASCII representation."""
+    """Format bytes (or any bytes-like object) as a nicely formatted hex dump with ASCII representation."""
+    data = bytes(data)  # copies memoryview/bytearray input once; bytes input is used as-is
+
+    # Convert the whole buffer once, each line is then just a slice of these strings
+    hex_all = data.hex(' ')
+    ascii_all = data.translate(_ASCII_TBL).decode('ascii')
+
     result = []
     for i in range(0, len(data), bytes_per_line):
-        chunk = data[i:i + bytes_per_line]
-        hex_part = ' '.join(f'{b:02x}' for b in chunk)
+        n = min(bytes_per_line, len(data) - i)
+        # Every byte takes 3 chars ('xx ') except the last one on the line
+        hex_part = hex_all[3 * i:3 * (i + n) - 1]
 
         # Pad the hex part to align the ASCII part
-        padding = '   ' * (bytes_per_line - len(chunk))
+        padding = '   ' * (bytes_per_line - n)
 
-        # Create ASCII representation
-        ascii_part = ''.join(chr(b) if 32 <= b <= 126 else '.' for b in chunk)
+        # ASCII representation
+        ascii_part = ascii_all[i:i + n]
 
         result.append(f"{i:04x}:  {hex_part}{padding}  |{ascii_part}|")
     return '\n'.join(result)
 
 
+def timed(func, *args, reps: int = 1, repeat: int = 1):
+    """
+    Call func(*args) reps times and measure it with the high resolution monotonic clock.
+
+    With repeat > 1 the whole measurement is taken repeat times and the best one is kept,
+    which filters out scheduler jitter the same way timeit.repeat() does.
+
+    Returns:
+        tuple: (last result, average seconds per call)
+    """
+    result = None
+    best_ns = None
+    for _ in range(repeat):
+        start_ns = time.perf_counter_ns()
+        for _ in range(reps):
+            result = func(*args)
+        elapsed_ns = (time.perf_counter_ns() - start_ns) // reps
+        if best_ns is None or elapsed_ns < best_ns:
+            best_ns = elapsed_ns
+    return result, best_ns / 1e9
+
+
+def key_shuffle(rng: MaxRNG, items: list, keys=None) -> list:
+    """
+    Return a shuffled copy of items by sorting on random 32-bit keys.
+
+    Like rng.shuffle() this needs a single generate() call, but it leaves items untouched and
+    does the permutation with a C-level sort instead of a Python-level swap loop.
+    Pass keys (len(items) random integers) to reuse keys that were already generated in bulk.
+    """
+    if keys is None:
+        keys = rng.generate_uint32_array(len(items))
+    return [items[i] for i in sorted(range(len(items)), key=keys.__getitem__)]
+
+
+class HybridRNG:
+    """
+    xorshift64* generator seeded from the hardware RNG and reseeded every reseed_every outputs.
+
+    Each value costs a few integer operations instead of a DLL call, while the state still
+    comes from hardware entropy. Not suitable for keys or other secrets - use generate_secure().
+    """
+
+    _MASK = (1 << 64) - 1
+
+    def __init__(self, rng: MaxRNG, reseed_every: int = 1_000_000):
+        self.rng = rng
+        self.reseed_every = reseed_every
+        self.reseed()
+
+    def reseed(self) -> None:
+        """Draw a fresh non-zero 64-bit state from the hardware RNG."""
+        self.state = int.from_bytes(self.rng.generate(8), 'little') or 1
+        self.count = 0
+
+    def next64(self) -> int:
+        """Return the next 64-bit unsigned integer."""
+        if self.count >= self.reseed_every:
+            self.reseed()
+        self.count += 1
+        x = self.state
+        x ^= x >> 12
+        x ^= (x << 25) & self._MASK
+        x ^= x >> 27
+        self.state = x
+        return (x * 0x2545F4914F6CDD1D) & self._MASK
+
+
+def write_random_file(rng: MaxRNG, path: str, size: int, chunk_size: int = 1 << 16) -> str:
+    """
+    Write size random bytes to path and return their SHA-256 hex digest.
+
+    Data is generated in chunk_size blocks (64 KiB by default), so small files take a single
+    DLL call while large ones never need to be held in memory all at once. One bytearray is
+    filled in place by generate_into() for every block, each block is written with one
+    unbuffered os.write (O_BINARY keeps Windows from translating newlines) and hashed while
+    it is still in memory.
+    """
+    h = hashlib.sha256()
+    view = memoryview(bytearray(min(chunk_size, size)))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o600)
+    try:
+        remaining = size
+        while remaining > 0:
+            n = rng.generate_into(view, min(chunk_size, remaining))
+            block = view[:n]
+            os.write(fd, block)
+            h.update(block)
+            remaining -= n
+    finally:
+        os.close(fd)
+    return h.hexdigest()
+
+
+def file_sha256(path: str) -> str:
+    """Hash a file with SHA-256 using a reusable read buffer instead of loading it whole."""
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "sha256").hexdigest()
+
+        h = hashlib.sha256()
+        view = memoryview(bytearray(65536))
+        while n := f.readinto(view):
+            h.update(view[:n])
+        return h.hexdigest()
+
+
 def check_rng_availability() -> bool:
     """
     Check if hardware RNG is available and print detailed information.
@@ -60,61 +206,70 @@ def check_rng_availability() -> bool:
     """
     print_separator("HARDWARE RNG AVAILABILITY CHECK")
 
+    # The probes depend on each other (init needs the RNG, the check needs init), so they stay
+    # sequential; the status lines are collected and written once at the end instead
+    out = io.StringIO()
+    say = partial(print, file=out)
+
     try:
-        rng = MaxRNG()
+        try:
+            # Also initializes threading support (a no-op in the DLL if it was already initialized)
+            rng = get_rng()
+        except Exception as e:
+            if _RNG is None:
+                raise
+            # The instance exists, so it was the threading init that failed: report the state it left
+            state = 'YES' if _RNG.is_threading_available() else 'NO'
+            say(f"⚠️ Failed to initialize RNG threading: {e} (threading support: {state})")
+            return False
 
         # Check basic RNG availability
         rng_available = rng.is_available()
-        print(f"Hardware RNG: {'AVAILABLE' if rng_available else 'NOT AVAILABLE'}")
+        say(f"Hardware RNG: {'AVAILABLE' if rng_available else 'NOT AVAILABLE'}")
 
         if not rng_available:
-            print("⚠️ Hardware RNG not available. This could be because:")
-            print("  - Your CPU doesn't support the RDRAND instruction")
-            print("  - The RNG hardware module is disabled in BIOS/UEFI")
-            print("  - The DLL failed to detect the hardware properly")
-            return False
-
-        # First check if threading is available before initialization
-        pre_init_threading = rng.is_threading_available()
-        print(f"Threading support before initialization: {'YES' if pre_init_threading else 'NO'}")
-
-        # Initialize threading support
-        print("\nInitializing RNG threading support...")
-        try:
-            rng.init_threading()
-            print("✓ RNG threading initialized successfully")
-        except Exception as e:
-            print(f"⚠️ Failed to initialize RNG threading: {e}")
+            say("⚠️ Hardware RNG not available. This could be because:")
+            say("  - Your CPU doesn't support the RDRAND instruction")
+            say("  - The RNG hardware module is disabled in BIOS/UEFI")
+            say("  - The DLL failed to detect the hardware properly")
             return False
 
-        # Check again after initialization
+        # Single check, get_rng() already initialized threading
         post_init_threading = rng.is_threading_available()
-        print(f"Threading support after initialization: {'YES' if post_init_threading else 'NO'}")
+        say(f"Threading support: {'YES' if post_init_threading else 'NO'}")
 
         if post_init_threading:
-            print("\n✓ Hardware RNG is FULLY AVAILABLE with threading support")
+            say("\n✓ Hardware RNG is FULLY AVAILABLE with threading support")
             return True
         else:
-            print("\n⚠️ Hardware RNG is available but threading support failed to initialize")
+            say("\n⚠️ Hardware RNG is available but threading support failed to initialize")
             return False
 
     except Exception as e:
-        print(f"❌ Error checking RNG availability: {e}")
+        say(f"❌ Error checking RNG availability: {e}")
         return False
+    finally:
+        sys.stdout.write(out.getvalue())
 
 
 def basic_rng_demo() -> None:
     """Demonstrate the basic RNG functionality."""
     print_separator("BASIC RNG DEMONSTRATION")
 
-    rng = MaxRNG()
+    rng = get_rng()
 
     # Generate different sizes of random data
     sizes = [16, 32, 64, 128, 256]
 
     print("Generating random bytes of different sizes using basic generate():")
+    # One call for all sizes, then slice locally - avoids a DLL round trip per size
+    pool = memoryview(rng.generate(sum(sizes)))
+    offset = 0
     for size in sizes:
-        random_bytes = rng.generate(size)
+        # memoryview slices share the pool buffer instead of copying it per size; base64 reads the
+        # slice directly, hex_format copies it once into bytes for its translate() pass
+        random_bytes = pool[offset:offset + size]
+        offset += size
         print(f"\n{size} random bytes:")
         print(hex_format(random_bytes))
         print(f"Base64: {base64.b64encode(random_bytes).decode()}")
@@ -129,7 +284,7 @@ def ultra_rng_demo() -> None:
     """Demonstrate the ultra RNG functionality with different complexity levels."""
     print_separator("ULTRA RNG DEMONSTRATION")
 
-    rng = MaxRNG()
+    rng = get_rng()
 
     # Demonstrate different complexity levels
     print("The generate_ultra() function allows specifying a 'complexity' parameter")
@@ -138,25 +293,23 @@ def ultra_rng_demo() -> None:
 
     complexities = [1, 3, 5, 7, 10]
 
-    # Track timing for performance comparison
-    timing_results = []
+    # The DLL call releases the GIL, so the samples shown for every level are generated concurrently
+    futures = [_POOL.submit(rng.generate_ultra, 64, complexity) for complexity in complexities]
+    for complexity, future in zip(complexities, futures):
+        print(f"\nComplexity level {complexity}:")
+        print(hex_format(future.result()))
 
-    for complexity in complexities:
-        start_time = time.time()
-        random_bytes = rng.generate_ultra(64, complexity)
-        elapsed = time.time() - start_time
-        timing_results.append((complexity, elapsed))
-
-        print(f"\nComplexity level {complexity} (took {elapsed:.6f} seconds):")
-        print(hex_format(random_bytes))
+    # Timings are taken one level at a time, so the calls do not compete for cores and entropy
+    # sources, and the best of three runs filters out scheduler jitter
+    timing_results = [(complexity, timed(rng.generate_ultra, 64, complexity, repeat=3)[1])
+                      for complexity in complexities]
 
     print("\nPerformance comparison:")
     print("Complexity | Time (seconds) | Relative Speed")
     print("-----------+---------------+--------------")
-    base_time = timing_results[0][1]  # Use complexity 1 as baseline
-    for complexity, elapsed in timing_results:
-        relative = elapsed / base_time
-        print(f"{complexity:^11} | {elapsed:^15.6f} | {relative:^14.2f}x")
+    base_time = timing_results[0][1] or 1e-9  # Use complexity 1 as baseline
+    print("\n".join(f"{complexity:^11} | {elapsed:^15.9f} | {elapsed / base_time:^14.2f}x"
+                    for complexity, elapsed in timing_results))
 
     print("\nRecommended complexity levels:")
     print("- 1-2:  Good for non-critical applications, fastest performance")
@@ -168,7 +321,7 @@ def threaded_rng_demo() -> None:
     """Demonstrate thread-safe RNG functionality."""
     print_separator("THREAD-SAFE RNG DEMONSTRATION")
 
-    rng = MaxRNG()
+    rng = get_rng()
 
     # Ensure threading is available
     if not rng.is_threading_available():
@@ -193,70 +346,76 @@ def threaded_rng_demo() -> None:
     # Multithreaded demonstration
     print("\nMulti-threaded example:")
 
+    # Bind the bound method once so each worker does a closure lookup instead of an attribute lookup
+    generate_threadsafe = rng.generate_threadsafe
+
     def worker_function(thread_id, size):
         """Worker function that generates random bytes in a thread."""
         try:
-            start_time_ = time.time()
-            data = rng.generate_threadsafe(size)
-            elapsed = time.time() - start_time_
-            return {
-                "thread_id": thread_id,
-                "data": data,
-                "size": size,
-                "time": elapsed,
-                "success": True
-            }
+            data, elapsed = timed(generate_threadsafe, size)
+            return WorkerResult(thread_id, data=data, size=size, time=elapsed, success=True)
         except Exception as e_:
-            return {
-                "thread_id": thread_id,
-                "error": str(e_),
-                "success": False
-            }
+            return WorkerResult(thread_id, error=str(e_))
 
-    # Use ThreadPoolExecutor for cleaner thread management
+    # Use the shared ThreadPoolExecutor for cleaner thread management
     num_threads = 8
     bytes_per_thread = 32
     print(f"Spawning {num_threads} threads, each generating {bytes_per_thread} bytes...")
 
-    results = []
-    with ThreadPoolExecutor(max_workers=num_threads) as executor:
-        # Submit all tasks and collect futures
-        futures = [executor.submit(worker_function, i, bytes_per_thread)
-                   for i in range(num_threads)]
+    # Submit all tasks and collect futures
+    futures = [_POOL.submit(worker_function, i, bytes_per_thread)
+               for i in range(num_threads)]
 
-        # Wait for all to complete and collect results
-        for future in futures:
-            results.append(future.result())
+    # Wait for all to complete and collect results
+    results = [future.result() for future in futures]
 
     # Report results
-    success_count = sum(1 for r in results if r["success"])
+    success_count = sum(1 for r in results if r.success)
     print(f"\n✓ {success_count}/{num_threads} threads completed successfully")
 
+    # Build the report in memory and write it once instead of a print() per line
+    out = io.StringIO()
     for result in results:
-        if result["success"]:
-            print(f"\nThread {result['thread_id']} ({result['time']:.6f}s):")
+        if result.success:
+            out.write(f"\nThread {result.thread_id} ({result.time:.9f}s):\n")
             # Just show a portion of the data for brevity
-            print(f"  {result['data'][:16].hex()}...")
+            out.write(f"  {result.data[:16].hex()}...\n")
         else:
-            print(f"\n❌ Thread {result['thread_id']} failed: {result['error']}")
+            out.write(f"\n❌ Thread {result.thread_id} failed: {result.error}\n")
+    sys.stdout.write(out.getvalue())
 
     # Higher concurrency stress test
-    print("\nHigh concurrency stress test (50 threads):")
-    num_stress_threads = 50
-    stress_size = 16
+    # One large request per core: tiny requests would only measure thread dispatch overhead
+    num_stress_threads = os.cpu_count() or 8
+    stress_size = 1 << 20  # 1 MiB
+    print(f"\nHigh concurrency stress test ({num_stress_threads} threads, 1 MiB each):")
+
+    # One success flag per task, set by index - no per-task result dict to build or inspect
+    stress_ok = bytearray(num_stress_threads)
+
+    def stress_worker(thread_id, size):
+        """Lightweight worker that only records whether generation succeeded."""
+        try:
+            generate_threadsafe(size)
+            stress_ok[thread_id] = 1
+        except Exception:
+            pass
 
-    with ThreadPoolExecutor(max_workers=num_stress_threads) as executor:
-        start_time = time.time()
-        futures = [executor.submit(worker_function, i, stress_size)
-                   for i in range(num_stress_threads)]
+    start_ns = time.perf_counter_ns()
+    futures = [_POOL.submit(stress_worker, i, stress_size)
+               for i in range(num_stress_threads)]
 
-        # Wait for all to complete
-        success_count = sum(1 for future in futures if future.result()["success"])
-        total_time = time.time() - start_time
+    # Wait for all to complete
+    wait(futures)
+    total_time = (time.perf_counter_ns() - start_ns) / 1e9
+    success_count = stress_ok.count(1)
 
     print(f"✓ {success_count}/{num_stress_threads} threads completed in {total_time:.3f}s")
     print(f"Average time per thread: {total_time / num_stress_threads:.6f}s")
-    print(f"Total random data generated: {success_count * stress_size} bytes")
+    total_bytes = success_count * stress_size
+    print(f"Total random data generated: {total_bytes} bytes")
+    if total_time > 0:
+        print(f"Aggregate throughput: {total_bytes / total_time / (1 << 20):.2f} MiB/s")
 
     print("\nThe thread-safe RNG function is essential for:")
     print("- Multi-threaded applications requiring random data")
@@ -268,7 +427,7 @@ def advanced_configuration_demo() -> None:
     """Demonstrate advanced configuration options of the MaxRNG."""
     print_separator("ADVANCED CONFIGURATION DEMONSTRATION")
 
-    rng = MaxRNG()
+    rng = get_rng()
 
     print("The MaxRNG library supports extensive configuration options")
     print("through the RNGConfig structure and generate_custom() method.\n")
@@ -287,11 +446,9 @@ def advanced_configuration_demo() -> None:
         # Create config with specific hash algorithm
         config = rng.create_config(hash_algo=algo)
 
-        start_time = time.time()
-        data = rng.generate_custom(64, config)
-        elapsed = time.time() - start_time
+        data, elapsed = timed(rng.generate_custom, 64, config)
 
-        print(f"\n{name} ({elapsed:.6f}s):")
+        print(f"\n{name} ({elapsed:.9f}s):")
         print(hex_format(data[:32]))  # Show first 32 bytes
 
     # Demonstrate different expansion methods
@@ -339,11 +496,9 @@ def advanced_configuration_demo() -> None:
     ]
 
     for mode, name in security_modes:
-        start_time = time.time()
-        data = rng.generate_custom(64, mode)
-        elapsed = time.time() - start_time
+        data, elapsed = timed(rng.generate_custom, 64, mode)
 
-        print(f"\n{name} ({elapsed:.6f}s):")
+        print(f"\n{name} ({elapsed:.9f}s):")
         print(hex_format(data[:32]))  # Show first 32 bytes
 
 
@@ -351,7 +506,7 @@ def entropy_sources_demo() -> None:
     """Demonstrate selection of entropy sources."""
     print_separator("ENTROPY SOURCES DEMONSTRATION")
 
-    rng = MaxRNG()
+    rng = get_rng()
 
     print("The MaxRNG library can use multiple entropy sources")
     print("Each source provides different types of randomness\n")
@@ -359,13 +514,22 @@ def entropy_sources_demo() -> None:
     # All available sources
     all_sources = ["cpu", "rdrand", "memory", "perf", "disk", "audio", "battery", "network"]
 
+    @lru_cache(maxsize=None)
+    def sources_config(sources: tuple):
+        """Build the config for a source combination once and reuse it across sections."""
+        return rng.create_config(sources=list(sources))
+
     # Test each source individually
     print("INDIVIDUAL ENTROPY SOURCES:")
 
+    # Sources that worked on their own, failed ones are skipped in the groups below
+    available = set()
+
     for source in all_sources:
         try:
-            config = rng.create_config(sources=[source])
+            config = sources_config((source,))
             data = rng.generate_custom(16, config)
+            available.add(source)
 
             print(f"\n{source.upper()} source only:")
             print(hex_format(data))
@@ -381,10 +545,14 @@ def entropy_sources_demo() -> None:
         (["disk", "audio", "network"], "I/O sources"),
         (all_sources, "ALL sources")
     ]
+    source_groups = [([src for src in sources if src in available], name) for sources, name in source_groups]
 
     for sources, name in source_groups:
+        if not sources:
+            print(f"\n{name} skipped: none of its sources are available")
+            continue
         try:
-            config = rng.create_config(sources=sources)
+            config = sources_config(tuple(sources))
             data = rng.generate_custom(32, config)
 
             print(f"\n{name}:")
@@ -393,20 +561,17 @@ def entropy_sources_demo() -> None:
             print(f"\n{name} failed: {e}")
 
     # Measure source performance
-    print("\nSOURCE PERFORMANCE COMPARISON:")
-    print("Source Group | Time (seconds) | Relative Speed")
-    print("-------------+----------------+--------------")
-
     perf_results = []
     base_time = None
 
     for sources, name in source_groups:
+        if not sources:
+            perf_results.append((name, None))
+            continue
         try:
-            config = rng.create_config(sources=sources)
+            config = sources_config(tuple(sources))
 
-            start_time = time.time()
-            rng.generate_custom(256, config)
-            elapsed = time.time() - start_time
+            _, elapsed = timed(rng.generate_custom, 256, config)
 
             perf_results.append((name, elapsed))
             if base_time is None:
@@ -415,39 +580,46 @@ def entropy_sources_demo() -> None:
         except Exception:
             perf_results.append((name, None))
 
+    out = io.StringIO()
+    out.write("\nSOURCE PERFORMANCE COMPARISON:\n")
+    out.write("Source Group | Time (seconds) | Relative Speed\n")
+    out.write("-------------+----------------+--------------\n")
     for name, elapsed in perf_results:
         if elapsed is not None:
             relative = elapsed / base_time
-            print(f"{name[:12]:13} | {elapsed:^16.6f} | {relative:^14.2f}x")
+            out.write(f"{name[:12]:13} | {elapsed:^16.9f} | {relative:^14.2f}x\n")
         else:
-            print(f"{name[:12]:13} | {'FAILED':^16} | {'N/A':^14}")
+            out.write(f"{name[:12]:13} | {'FAILED':^16} | {'N/A':^14}\n")
+    sys.stdout.write(out.getvalue())
+    sys.stdout.flush()
 
 
 def utility_functions_demo() -> None:
     """Demonstrate the utility functions in MaxRNG."""
     print_separator("UTILITY FUNCTIONS DEMONSTRATION")
 
-    rng = MaxRNG()
+    rng = get_rng()
 
     print("MaxRNG provides utility functions for common random number needs")
 
     # 1. Integer generation
     print("\n1. RANDOM INTEGER GENERATION")
 
+    # generate_uint32()/generate_uint64() cost one DLL call per value, so batch when several are needed
     print("32-bit unsigned integers:")
-    for _ in range(5):
-        print(f"  {rng.generate_uint32():10d}")
+    for value in rng.generate_uint32_array(5):
+        print(f"  {value:10d}")
 
     print("\n64-bit unsigned integers:")
-    for _ in range(5):
-        print(f"  {rng.generate_uint64():20d}")
+    for value in rng.generate_uint64_array(5):
+        print(f"  {value:20d}")
 
     # 2. Floating-point numbers
     print("\n2. RANDOM FLOATING-POINT NUMBERS")
 
     print("Random floats between 0.0 and 1.0:")
-    for _ in range(5):
-        print(f"  {rng.generate_float():.16f}")
+    for value in rng.generate_float_array(5):
+        print(f"  {value:.16f}")
 
     # 3. Range generation
     print("\n3. RANDOM INTEGERS IN RANGES")
@@ -456,8 +628,8 @@ def utility_functions_demo() -> None:
 
     for start, end in ranges:
         print(f"\nRange [{start}, {end}):")
-        for _ in range(5):
-            print(f"  {rng.generate_range(start, end)}")
+        for value in rng.generate_range_array(start, end, 5):
+            print(f"  {value}")
 
     # 4. List operations
     print("\n4. LIST OPERATIONS")
@@ -470,18 +642,31 @@ def utility_functions_demo() -> None:
 
     # List shuffling
     print("\nList shuffling:")
+    # Copy once and keep shuffling the same list in place, a shuffle of a shuffle is still uniform
+    fruits_copy = fruits.copy()
     for _ in range(3):
-        # Make a copy to shuffle
-        fruits_copy = fruits.copy()
         shuffled = rng.shuffle(fruits_copy)
         print(f"  {shuffled}")
 
+    # Sort-by-random-key shuffling, the keys for all three rounds come from a single DLL call
+    print("\nList shuffling with random sort keys (returns a new list):")
+    n = len(fruits)
+    all_keys = rng.generate_uint32_array(3 * n)
+    for round_ in range(3):
+        print(f"  {key_shuffle(rng, fruits, all_keys[round_ * n:(round_ + 1) * n])}")
+
+    # Both take one DLL call now, so this compares the Python swap loop against a C-level sort
+    big_list = list(range(10_000))
+    _, fy_time = timed(rng.shuffle, big_list.copy())
+    _, key_time = timed(key_shuffle, rng, big_list)
+    print(f"\nShuffling {len(big_list)} items: shuffle() {fy_time:.6f}s vs random keys {key_time:.6f}s")
+
 
 def practical_applications() -> None:
     """Demonstrate practical applications of hardware RNG."""
     print_separator("PRACTICAL APPLICATIONS")
 
-    rng = MaxRNG()
+    rng = get_rng()
 
     # 1. Cryptographic keys
     print("\n1. GENERATING CRYPTOGRAPHIC KEYS")
@@ -498,16 +683,23 @@ def practical_applications() -> None:
     # 2. Random passwords
     print("\n2. GENERATING SECURE PASSWORDS")
 
-    def generate_password(length=16):
-        """Generate a random password using hardware RNG."""
-        # Get random bytes and convert to base64
-        random_bytes = rng.generate(length)
-        # Use base64 encoding to get printable chars, remove padding
-        b64_string = base64.b64encode(random_bytes).decode('ascii').rstrip('=')
-        # Take the first 'length' characters
-        return b64_string[:length]
-
-    passwords = [generate_password(length) for length in [8, 12, 16, 24]]
+    def generate_passwords(lengths):
+        """Generate one random password per length from a single hardware RNG call."""
+        # Every 3 bytes become 4 base64 chars, so only request what each password needs
+        needed = [math.ceil(length * 3 / 4) for length in lengths]
+        pool = memoryview(rng.generate(sum(needed)))
+        result = []
+        offset = 0
+        for length, n in zip(lengths, needed):
+            # Each password gets its own bytes - a shared prefix would make shorter ones guessable
+            # Use URL-safe base64 encoding to get printable chars without '+' or '/', remove padding
+            b64_string = base64.urlsafe_b64encode(pool[offset:offset + n]).decode('ascii').rstrip('=')
+            # Take the first 'length' characters
+            result.append(b64_string[:length])
+            offset += n
+        return result
+
+    passwords = generate_passwords([8, 12, 16, 24])
     for i, password in enumerate(passwords):
         print(f"Password {i + 1} (length {len(password)}): {password}")
 
@@ -517,50 +709,57 @@ def practical_applications() -> None:
     file_size = 1024  # 1 KB
     file_path = "random_data.bin"
 
-    with open(file_path, "wb") as f:
-        # Generate data in chunks for efficiency
-        chunk_size = 256
-        remaining = file_size
-
-        while remaining > 0:
-            size = min(chunk_size, remaining)
-            data = rng.generate(size)
-            f.write(data)
-            remaining -= size
+    # A 1 KB file fits in one chunk, so this is a single DLL call and a single write
+    file_hash = write_random_file(rng, file_path, file_size)
 
     print(f"Generated random file: {file_path} ({file_size} bytes)")
 
-    # Calculate file hash to verify randomness
-    with open(file_path, "rb") as f:
-        file_data = f.read()
-        file_hash = hashlib.sha256(file_data).hexdigest()
-
     print(f"File SHA-256: {file_hash}")
 
+    # Verify what actually reached the disk
+    if file_sha256(file_path) == file_hash:
+        print("✓ File contents verified against the generated data")
+    else:
+        print("❌ File contents do not match the generated data")
+
     # 4. Compare with software RNG
     print("\n4. COMPARISON WITH SOFTWARE RNG")
     print("Hardware RNG vs Python's cryptographic RNG (secrets module)")
 
-    sizes_to_test = [16, 64, 256, 1024]
+    # Small sizes are dominated by fixed per-call overhead, the large ones show real throughput
+    sizes_to_test = [16, 64, 256, 1024, 64 * 1024, 1024 * 1024]
+
+    # One os.urandom() call for every size, sliced per row: the syscall cost is paid once, which
+    # is how an application drawing many small values from a buffer would actually behave
+    sw_pool = memoryview(os.urandom(sum(sizes_to_test)))
+    offset = 0
 
-    print("\nSize (bytes) | Hardware RNG time | Software RNG time | Ratio")
-    print("-------------+-------------------+-------------------+-------")
+    out = io.StringIO()
+    out.write("\nSize (bytes) | Hardware RNG time | Software RNG time | Pooled SW time    | Ratio   | HW MB/s  | SW MB/s\n")
+    out.write("-------------+-------------------+-------------------+-------------------+---------+----------+----------\n")
 
     for size in sizes_to_test:
-        # Hardware RNG timing
-        hw_start = time.time()
-        _ = rng.generate(size)
-        hw_time = time.time() - hw_start
+        # Hardware RNG timing, best of 3 (each call spends milliseconds collecting entropy)
+        _, hw_time = timed(rng.generate, size, repeat=3)
+
+        # Software RNG timing, repeated since a single call is below clock resolution
+        _, sw_time = timed(secrets.token_bytes, size, reps=max(1, 200_000 // size), repeat=5)
 
-        # Software RNG timing
-        sw_start = time.time()
-        _ = secrets.token_bytes(size)
-        sw_time = time.time() - sw_start
+        # Pooled software RNG: slicing (copying) this size out of the pre-drawn buffer
+        _, pooled_time = timed(lambda: bytes(sw_pool[offset:offset + size]), reps=max(1, 200_000 // size), repeat=5)
+        offset += size
 
         # Calculate ratio (higher means hardware is slower)
         ratio = hw_time / sw_time if sw_time > 0 else float('inf')
 
-        print(f"{size:^13} | {hw_time:^19.6f} | {sw_time:^19.6f} | {ratio:^7.2f}x")
+        # Throughput in MB/s
+        hw_mbps = size / hw_time / 1e6 if hw_time > 0 else float('inf')
+        sw_mbps = size / sw_time / 1e6 if sw_time > 0 else float('inf')
+
+        out.write(f"{size:^13} | {hw_time:^19.9f} | {sw_time:^19.9f} | {pooled_time:^19.9f} | {ratio:^7.2f}x | "
+                  f"{hw_mbps:^8.2f} | {sw_mbps:^8.2f}\n")
+    sys.stdout.write(out.getvalue())
+    sys.stdout.flush()
 
     print("\nNote: Hardware RNG may be slower but provides pseudo-true randomness,")
     print("which is crucial for security-sensitive applications.")
@@ -587,7 +786,7 @@ def error_handling_demo() -> None:
     """Demonstrate proper error handling with MaxRNG."""
     print_separator("ERROR HANDLING DEMONSTRATION")
 
-    rng = MaxRNG()
+    rng = get_rng()
 
     # 1. Invalid size parameter
     print("\n1. HANDLING INVALID SIZE PARAMETER")
@@ -607,6 +806,28 @@ def error_handling_demo() -> None:
     except ValueError as e:
         print(f"✓ Caught expected error: {e}")
 
+    # 3. Falling back to software RNG
+    print("\n3. FALLING BACK TO SOFTWARE RNG")
+    try:
+        print("Attempting generate_ultra(32, -5) with a secrets fallback...")
+        random_bytes = rng.generate_ultra(32, -5)
+        print("Result (hardware):", random_bytes.hex())
+    except (ValueError, RuntimeError) as e:
+        random_bytes = secrets.token_bytes(32)
+        print(f"✓ Hardware call rejected ({e}), used secrets.token_bytes instead")
+        print("Result (software):", random_bytes.hex())
+
+    # 4. Hybrid generation: hardware seed, software stream
+    print("\n4. HYBRID HARDWARE-SEEDED GENERATOR")
+    print("For bulk non-secret numbers, seed a fast PRNG from hardware and reseed periodically")
+    count = 100_000
+    _, hw_time = timed(rng.generate_uint64_array, count)
+    hybrid = HybridRNG(rng)
+    next64 = hybrid.next64
+    _, hybrid_time = timed(lambda: [next64() for _ in range(count)])
+    print(f"{count} x 64-bit values, bulk hardware: {hw_time:.6f}s")
+    print(f"{count} x 64-bit values, hybrid:        {hybrid_time:.6f}s")
+
     print("\nBest practices for error handling:")
     print("1. Always check hardware availability with is_available()")
     print("2. Always initialize threading with init_threading() before threaded usage")
@@ -615,17 +836,85 @@ def error_handling_demo() -> None:
     print("5. Have a fallback mechanism for when hardware RNG is unavailable")
 
 
+class _ThreadOutput(io.TextIOBase):
+    """sys.stdout stand-in that sends a thread's writes to its own buffer while it is capturing."""
+
+    def __init__(self, stream):
+        super().__init__()
+        self.stream = stream
+        self._local = threading.local()
+
+    def write(self, s: str) -> int:
+        return getattr(self._local, "buffer", self.stream).write(s)
+
+    def flush(self) -> None:
+        getattr(self._local, "buffer", self.stream).flush()
+
+    def capture(self, func) -> str:
+        """
+        Run func with everything it prints on this thread collected, and return that output.
+
+        If func raises, the output printed so far is kept and the traceback is appended to it,
+        so one failing demo does not take the others' output down with it.
+        """
+        self._local.buffer = io.StringIO()
+        try:
+            try:
+                func()
+            except Exception:
+                self._local.buffer.write(f"\n❌ {func.__name__} failed:\n{traceback.format_exc()}")
+            return self._local.buffer.getvalue()
+        finally:
+            del self._local.buffer
+
+
+def run_all_demos(funcs: list) -> None:
+    """
+    Run every demo, the ones without timings concurrently on a dedicated thread pool.
+
+    Demos that print timing tables, or touch shared resources (the thread-pool stress test, the
+    random file on disk), run afterwards one at a time so their numbers are not measured under
+    contention. Each demo's output is buffered and printed in menu order, with the traceback in
+    place of the rest of its output if it fails.
+    The demos get their own executor, since some of them wait on tasks submitted to _POOL.
+    """
+    serial = (ultra_rng_demo, threaded_rng_demo, advanced_configuration_demo, entropy_sources_demo,
+              utility_functions_demo, practical_applications, error_handling_demo)
+    parallel = [func for func in funcs if func not in serial]
+
+    output = _ThreadOutput(sys.stdout)
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, len(parallel))) as executor:
+            futures = {func: executor.submit(output.capture, func) for func in parallel}
+        outputs = {func: future.result() for func, future in futures.items()}
+        for func in funcs:
+            if func in serial:
+                outputs[func] = output.capture(func)
+    finally:
+        sys.stdout = output.stream
+
+    for func in funcs:
+        sys.stdout.write(outputs[func])
+    sys.stdout.flush()
+
+
 def main() -> None:
     """Main function to run all demonstrations."""
     print_separator("HARDWARE RANDOM NUMBER GENERATOR (HRNG) COMPREHENSIVE DEMO")
     print("This example demonstrates all features of the MaxRNG hardware RNG module")
 
+    # Without a terminal (CI, piped runs) never block on input(): run everything unless
+    # PYCTOOLS_DEMO selects a specific demo
+    interactive = sys.stdin.isatty()
+    env_choice = os.environ.get("PYCTOOLS_DEMO")
+
     # First check if hardware RNG is available at all
     if not check_rng_availability():
         print("\n❌ Hardware RNG is not fully available.")
         print("Some demonstrations may fail or fall back to software RNG.")
         print("Do you want to continue anyway? (y/n)")
-        if input().lower() != 'y':
+        if (input() if interactive else 'y').lower() != 'y':
             print("Exiting demonstration.")
             return
 
@@ -646,7 +935,12 @@ def main() -> None:
     for key, (name, _) in demos.items():
         print(f"{key}. {name}")
 
-    choice = input("\nEnter your choice (or 'q' to quit): ").strip()
+    if env_choice is not None:
+        choice = env_choice.strip()
+    elif interactive:
+        choice = input("\nEnter your choice (or 'q' to quit): ").strip()
+    else:
+        choice = "9"
 
     if choice.lower() == 'q':
         print("Exiting demonstration.")
@@ -654,9 +948,8 @@ def main() -> None:
 
     if choice == "9":
         # Run all demos
-        for key, (_, func) in demos.items():
-            if key != "9" and func is not None:
-                func()
+        print("\nRunning all demos, output is shown once they have all finished...")
+        run_all_demos([func for key, (_, func) in demos.items() if key != "9" and func is not None])
     elif choice in demos:
         # Run selected demo
         _, func = demos[choice]
@@ -12,6 +12,7 @@ This example shows:
 import json
 import os
 import random
+import tempfile
 import time
 from typing import Dict, Any
 
@@ -34,7 +35,9 @@ def simulate_workload(intensity: int = 1) -> None:
     """
     # CPU-intensive work
     print(f"Simulating CPU-intensive work (level {intensity})...")
-    _ = [x ** 2 for x in range(intensity * 10**6)]
+    # Pure-Python arithmetic on purpose: this is the load being measured. Summing instead of
+    # building a list keeps this phase CPU-bound and leaves memory growth to the next phase
+    _ = sum(x * x for x in range(intensity * 10**6))
 
     # Memory-intensive work
     print(f"Simulating memory-intensive work (level {intensity})...")
@@ -43,18 +46,16 @@ def simulate_workload(intensity: int = 1) -> None:
 
     # I/O-intensive work (file operations)
     print(f"Simulating I/O-intensive work (level {intensity})...")
-    temp_filename = "temp_workload_file.txt"
-    with open(temp_filename, "w") as f:
+    # A real (not spooled) temporary file, so the reads and writes still show up in the I/O
+    # metrics; it is opened once for both passes and deleted by the OS when closed
+    with tempfile.TemporaryFile("w+") as f:
         for i in range(intensity * 100):
             f.write(f"Line {i}: " + "X" * 1000 + "\n")
 
-    # Read the file back
-    with open(temp_filename, "r") as f:
+        # Read the file back
+        f.seek(0)
         _ = f.read()
 
-    # Clean up
-    os.remove(temp_filename)
-
     # Force garbage collection to show memory changes
     import gc
     gc.collect()
@@ -310,20 +311,17 @@ def demo_other_process_monitoring() -> None:
         return
 
     if processes_available:
+        # Enumerate the processes once and reuse the list for both the listing and the search
+        processes = list(psutil.process_iter(['pid', 'name']))
+
         print("Available processes (first 5):")
-        for i, proc in enumerate(psutil.process_iter(['pid', 'name'])):
-            if i >= 5:
-                break
+        for proc in processes[:5]:
             print(f"  PID {proc.info['pid']}: {proc.info['name']}")
 
         # Try to monitor a system process like explorer.exe on Windows
         target_name = "explorer.exe"
-        target_pid = None
-
-        for proc in psutil.process_iter(['pid', 'name']):
-            if proc.info['name'].lower() == target_name:
-                target_pid = proc.info['pid']
-                break
+        target_pid = next((proc.info['pid'] for proc in processes
+                           if (proc.info['name'] or "").lower() == target_name), None)
 
         if target_pid:
             print(f"\nAttempting to monitor {target_name} (PID {target_pid})")
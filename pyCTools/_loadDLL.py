@@ -1,6 +1,6 @@
 import ctypes
 import os
-import platform
+import sys
 from typing import Callable, Optional
 
 
@@ -50,8 +50,8 @@ def load_dll(
     - The default search path assumes a project structure with DLLs in 'bin/x64' or 'bin/x86'.
     """
 
-    # Determine system architecture to pick the correct DLL version
-    arch = 'x64' if platform.architecture()[0] == '64bit' else 'x86'
+    # Determine interpreter architecture to pick the correct DLL version (pointer size, no platform probing)
+    arch = 'x64' if sys.maxsize > 2 ** 32 else 'x86'
 
     # Construct DLL filename based on prefix and architecture suffix
     dll_name = f'{dll_prefix_name}_{arch}.dll'
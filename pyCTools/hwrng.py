@@ -1,5 +1,10 @@
+import base64
+import binascii
 import ctypes
 import enum
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Union
 
 from pyCTools._loadDLL import load_dll
@@ -87,6 +92,33 @@ class RNGConfig(ctypes.Structure):
     ]
 
 
+# Random floats use the top 53 bits of a 64-bit draw, the full precision of a double, which gives
+# every multiple of 2**-53 in [0.0, 1.0) the same probability
+_FLOAT_SCALE = 1.0 / (1 << 53)
+
+
+# Per-thread scratch buffer the generate methods let the DLL write into, grown on demand.
+# It saves one allocation per call (the result is still copied out into bytes), so it is kept
+# small: requests above _SCRATCH_MAX get a one-off buffer that is freed with the call.
+_SCRATCH_MAX = 64 * 1024
+_scratch = threading.local()
+
+
+def _scratch_buffer(size: int):
+    """
+    Return a ctypes c_ubyte array of length size backed by this thread's scratch buffer.
+
+    The scratch buffer lives as long as its thread, so every thread that ever called a generate
+    method (pool workers included) keeps up to _SCRATCH_MAX (64 KiB) alive.
+    """
+    if size > _SCRATCH_MAX:
+        return (ctypes.c_ubyte * size)()
+    buf = getattr(_scratch, "buf", None)
+    if buf is None or len(buf) < size:
+        buf = _scratch.buf = bytearray(max(size, 256))
+    return (ctypes.c_ubyte * size).from_buffer(buf)
+
+
 class MaxRNG:
     """
     Advanced wrapper for the hRng hardware random number generator.
@@ -114,9 +146,19 @@ class MaxRNG:
         random_hex = rng.generate_custom(32, config)
     """
 
+    # DLL handle with its function signatures already set up, shared by every instance
+    _shared_dll = None
+
     # Internal handlers
     def __init__(self):
-        """Initialize the MaxRNG wrapper by loading the appropriate DLL."""
+        """Initialize the MaxRNG wrapper, loading the appropriate DLL on first use."""
+        # Preset configs built by generate_custom, keyed by SecurityMode
+        self._preset_configs = {}
+
+        if MaxRNG._shared_dll is not None:
+            self.dll = MaxRNG._shared_dll
+            return
+
         # Load the DLL using the load_dll helper with WinDLL loader
         self.dll = load_dll(dll_prefix_name="hRng", dll_load_func=ctypes.WinDLL)
 
@@ -126,6 +168,8 @@ class MaxRNG:
         # Define advanced function signatures
         self._setup_advanced_functions()
 
+        MaxRNG._shared_dll = self.dll
+
     def _setup_basic_functions(self):
         """Set up ctypes bindings for the basic RNG functions."""
         # int test_rng_available(void)
@@ -152,6 +196,11 @@ class MaxRNG:
         self.dll.maxrng_threadsafe.argtypes = [ctypes.POINTER(ctypes.c_ubyte), ctypes.c_int, ctypes.c_int]
         self.dll.maxrng_threadsafe.restype = ctypes.c_int
 
+        # int rdrand64(uint64_t *out), missing from DLLs built before it was added
+        if hasattr(self.dll, "rdrand64"):
+            self.dll.rdrand64.argtypes = [ctypes.POINTER(ctypes.c_uint64)]
+            self.dll.rdrand64.restype = ctypes.c_int
+
     def _setup_advanced_functions(self):
         """Set up ctypes bindings for the advanced RNG functions."""
         # void maxrng_dev_default_config(RNG_CONFIG *cfg, RNG_SECURITY_MODE mode)
@@ -238,15 +287,21 @@ class MaxRNG:
         config.mixing = mixing
         config.threading = threading
 
+        # The config only holds raw pointers to seed/info, so the buffers behind them are kept on the
+        # config object itself and live exactly as long as it does
+        config._keepalive = []
+
         # Set up seed if provided
         if seed:
-            seed_buffer = ctypes.create_string_buffer(seed)
+            seed_buffer = (ctypes.c_ubyte * len(seed)).from_buffer_copy(seed)
+            config._keepalive.append(seed_buffer)
             config.seed = ctypes.cast(seed_buffer, ctypes.c_void_p)
             config.seed_len = len(seed)
 
         # Set up info for HKDF if provided
         if info:
-            info_buffer = ctypes.create_string_buffer(info)
+            info_buffer = (ctypes.c_ubyte * len(info)).from_buffer_copy(info)
+            config._keepalive.append(info_buffer)
             config.info = ctypes.cast(info_buffer, ctypes.c_void_p)
             config.info_len = len(info)
 
@@ -291,12 +346,44 @@ class MaxRNG:
         Raises:
             RuntimeError: If the RNG function call fails.
         """
-        buf = (ctypes.c_ubyte * size)()
+        buf = _scratch_buffer(size)
         success = self.dll.maxrng(buf, size)
         if not success:
             raise RuntimeError("Failed to generate random data")
         return bytes(buf)
 
+    def generate_into(self, buffer: bytearray, size: Optional[int] = None) -> int:
+        """
+        Fill a caller-supplied writable buffer with random bytes using the standard RNG.
+
+        Unlike generate(), no new buffer is allocated and nothing is copied, so the same
+        bytearray can be reused across calls.
+
+        Args:
+            buffer (bytearray): Writable buffer (bytearray, writable memoryview, ...) to fill.
+            size (Optional[int]): Number of bytes to write from the start of buffer.
+                Defaults to the whole buffer.
+
+        Returns:
+            int: Number of random bytes written.
+
+        Raises:
+            ValueError: If size is negative or larger than the buffer.
+            RuntimeError: If the RNG function call fails.
+        """
+        view = memoryview(buffer).cast('B')
+        if size is None:
+            size = view.nbytes
+        if size < 0 or size > view.nbytes:
+            raise ValueError(f"size must be between 0 and {view.nbytes}")
+        if size == 0:
+            return 0
+        buf = (ctypes.c_ubyte * size).from_buffer(view)
+        success = self.dll.maxrng(buf, size)
+        if not success:
+            raise RuntimeError("Failed to generate random data")
+        return size
+
     def generate_ultra(self, size: int, complexity: int = 5) -> bytes:
         """
         Generate high-quality random bytes with specified complexity.
@@ -315,7 +402,7 @@ class MaxRNG:
         if not 1 <= complexity <= 10:
             raise ValueError("Complexity must be between 1 and 10")
 
-        buf = (ctypes.c_ubyte * size)()
+        buf = _scratch_buffer(size)
         success = self.dll.maxrng_ultra(buf, size, complexity)
         if not success:
             raise RuntimeError("Failed to generate ultra random data")
@@ -346,12 +433,48 @@ class MaxRNG:
                     "Threading initialization failed. Ensure the hRng DLL supports thread-safe operations."
                 )
 
-        buf = (ctypes.c_ubyte * size)()
+        buf = _scratch_buffer(size)
         success = self.dll.maxrng_threadsafe(buf, size, complexity)
         if not success:
             raise RuntimeError("Failed to generate thread-safe random data")
         return bytes(buf)
 
+    def generate_many(self, size: int, count: int, complexity: int = 2,
+                      max_workers: Optional[int] = None) -> List[bytes]:
+        """
+        Generate several independent blocks of random bytes concurrently.
+
+        ctypes releases the GIL around each DLL call, so the blocks are produced in
+        parallel by a short-lived thread pool using the thread-safe RNG function.
+
+        Args:
+            size (int): Number of random bytes in each block.
+            count (int): Number of blocks to generate.
+            complexity (int): Complexity level (1-5) passed to generate_threadsafe().
+            max_workers (Optional[int]): Maximum number of threads. Defaults to the CPU count.
+
+        Returns:
+            List[bytes]: count blocks of size random bytes, in request order.
+
+        Raises:
+            ValueError: If count is negative or complexity is out of range.
+            RuntimeError: If threading is not available or an RNG call fails.
+        """
+        if count < 0:
+            raise ValueError("Count must not be negative")
+        if count == 0:
+            return []
+
+        # Validate complexity and initialize threading once, before fanning out
+        first = self.generate_threadsafe(size, complexity)
+        if count == 1:
+            return [first]
+
+        workers = min(count - 1, max_workers or os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            rest = pool.map(lambda _: self.generate_threadsafe(size, complexity), range(count - 1))
+            return [first, *rest]
+
     def generate_custom(self,
                         size: int,
                         config: Optional[Union[RNGConfig, SecurityMode]] = None,
@@ -376,41 +499,43 @@ class MaxRNG:
         # Handle the case where config is a SecurityMode enum
         if isinstance(config, SecurityMode) or config is None:
             security_mode = config if config is not None else SecurityMode.BALANCED
-            config = self.create_config(security_mode=security_mode)
+            # Presets never change, so build each one once instead of on every call
+            config = self._preset_configs.get(security_mode)
+            if config is None:
+                config = self._preset_configs[security_mode] = self.create_config(security_mode=security_mode)
 
-        # Override output mode if specified
-        if output_mode is not None:
-            config.output_mode = output_mode
+        # An explicit output_mode overrides the one stored in config
+        if output_mode is None:
+            output_mode = config.output_mode
 
-        # Calculate needed buffer size based on output mode
-        out_size = size
-        if config.output_mode == OutputMode.HEX:
-            out_size = size * 2
-        elif config.output_mode == OutputMode.BASE64:
-            # Base64 encoding: 4 * ceil(n/3)
-            out_size = 4 * ((size + 2) // 3)
+        # The DLL always emits raw bytes, encoding is done by binascii/base64 which are much faster
+        # than the native byte-by-byte encoders and need no oversized output buffer.
+        # RAW is set on a private copy so a config shared between threads is never modified;
+        # its seed/info pointers stay valid because config is alive for the whole call.
+        raw_config = RNGConfig.from_buffer_copy(config)
+        raw_config.output_mode = OutputMode.RAW
 
-        # Allocate output buffer
-        out_buf = (ctypes.c_ubyte * out_size)()
+        # Output buffer, reused between calls on the same thread
+        out_buf = _scratch_buffer(size)
 
         # Call the advanced RNG function
         bytes_written = self.dll.maxrng_dev(
             out_buf,
-            out_size,
             size,
-            ctypes.byref(config)
+            size,
+            ctypes.byref(raw_config)
         )
 
         if bytes_written <= 0:
             raise RuntimeError("Failed to generate custom random data")
 
         # Convert to the appropriate return type
-        result = bytes(out_buf[:bytes_written])
-        if config.output_mode == OutputMode.RAW:
-            return result
-        else:
-            # For HEX and BASE64, return as string
-            return result.decode('ascii')
+        result = bytes(memoryview(out_buf)[:bytes_written])
+        if output_mode == OutputMode.HEX:
+            return binascii.hexlify(result).decode('ascii')
+        elif output_mode == OutputMode.BASE64:
+            return base64.b64encode(result).decode('ascii')
+        return result
 
     # Convenience methods for common random use cases
     def generate_hex(self, size: int, security: SecurityMode = SecurityMode.BALANCED) -> str:
@@ -444,14 +569,53 @@ class MaxRNG:
         return int.from_bytes(buf, byteorder='little', signed=False)
 
     def generate_float(self) -> float:
-        """Generate a random float between 0.0 and 1.0."""
-        # Use 4 bytes for good distribution
-        value = self.generate_uint32()
-        return value / (2 ** 32)
+        """Generate a random float in [0.0, 1.0) with 53-bit precision."""
+        return (self.generate_uint64() >> 11) * _FLOAT_SCALE
+
+    def generate_rdrand64(self) -> int:
+        """
+        Read a 64-bit unsigned integer directly from the CPU's RDRAND instruction.
+
+        Skips the entropy mixing and hashing done by the other generate methods, which makes it
+        far cheaper for small draws; use the hashed methods for long-term key material.
+
+        Returns:
+            int: Random 64-bit unsigned integer.
+
+        Raises:
+            RuntimeError: If the loaded DLL lacks rdrand64, RDRAND is unsupported or the draw fails.
+        """
+        if not hasattr(self.dll, "rdrand64"):
+            raise RuntimeError("rdrand64 is not available in the loaded hRng DLL")
+        value = ctypes.c_uint64()
+        if not self.dll.rdrand64(ctypes.byref(value)):
+            raise RuntimeError("RDRAND is not supported or failed to return data")
+        return value.value
+
+    # Batch variants, one DLL call for the whole array instead of one per value
+    def _generate_words(self, count: int, word_format: str) -> List[int]:
+        """Generate count unsigned integers of the given struct format ('I' or 'Q') from one RNG call."""
+        if count < 0:
+            raise ValueError("Count must not be negative")
+        if count == 0:
+            return []
+        return memoryview(self.generate(count * (4 if word_format == 'I' else 8))).cast(word_format).tolist()
+
+    def generate_uint32_array(self, count: int) -> List[int]:
+        """Generate a list of count random 32-bit unsigned integers. Raises ValueError if count is negative."""
+        return self._generate_words(count, 'I')
+
+    def generate_uint64_array(self, count: int) -> List[int]:
+        """Generate a list of count random 64-bit unsigned integers. Raises ValueError if count is negative."""
+        return self._generate_words(count, 'Q')
+
+    def generate_float_array(self, count: int) -> List[float]:
+        """Generate a list of count random floats in [0.0, 1.0), as generate_float(). Raises ValueError if count is negative."""
+        return [(value >> 11) * _FLOAT_SCALE for value in self.generate_uint64_array(count)]
 
     def generate_range(self, start: int, end: int) -> int:
         """
-        Generate a random integer in the specified range [start, end).
+        Generate a uniformly distributed random integer in the specified range [start, end).
 
         Args:
             start: Lower bound (inclusive)
@@ -465,26 +629,55 @@ class MaxRNG:
 
         range_size = end - start
 
-        # Determine how many bytes we need
-        if range_size <= 256:
-            bytes_needed = 1
-        elif range_size <= 65536:
-            bytes_needed = 2
-        elif range_size <= 16777216:
-            bytes_needed = 3
-        else:
-            bytes_needed = 4
+        # Lemire's multiply-shift reduction: take the high word of value * range_size and
+        # reject the few low words that would bias the result, so no modulo per draw
+        bits = 32 if range_size <= 1 << 32 else 64 * ((range_size.bit_length() + 63) // 64)
+        mask = (1 << bits) - 1
+        nbytes = bits // 8
+
+        m = int.from_bytes(self.generate(nbytes), byteorder='little') * range_size
+        if (m & mask) < range_size:
+            threshold = (1 << bits) % range_size
+            while (m & mask) < threshold:
+                m = int.from_bytes(self.generate(nbytes), byteorder='little') * range_size
+
+        return start + (m >> bits)
+
+    def generate_range_array(self, start: int, end: int, count: int) -> List[int]:
+        """
+        Generate count uniformly distributed random integers in [start, end) from a single RNG call.
 
-        # For large ranges, use 8 bytes
-        if range_size > 4294967296:
-            bytes_needed = 8
+        Applies generate_range()'s multiply-shift reduction to a batch of 32- or 64-bit words. The rare
+        draws that would be biased are replaced by individual generate_range() calls, and ranges wider
+        than 2**64 fall back to generate_range() for every value.
 
-        # Get random bytes and convert to integer
-        buf = self.generate(bytes_needed)
-        value = int.from_bytes(buf, byteorder='little', signed=False)
+        Args:
+            start: Lower bound (inclusive)
+            end: Upper bound (exclusive)
+            count: Number of integers to generate
 
-        # Map to the desired range
-        return start + (value % range_size)
+        Returns:
+            List[int]: count random integers in the range
+
+        Raises:
+            ValueError: If end is not greater than start or count is negative
+        """
+        if end <= start:
+            raise ValueError("End must be greater than start")
+        if count < 0:
+            raise ValueError("Count must not be negative")
+        range_size = end - start
+        if range_size > 1 << 64:
+            return [self.generate_range(start, end) for _ in range(count)]
+
+        bits = 32 if range_size <= 1 << 32 else 64
+        mask = (1 << bits) - 1
+        threshold = (1 << bits) % range_size
+        result = []
+        for value in self._generate_words(count, 'I' if bits == 32 else 'Q'):
+            m = value * range_size
+            result.append(start + (m >> bits) if (m & mask) >= threshold else self.generate_range(start, end))
+        return result
 
     # Convenience methods for common operations
     def choose(self, items: List) -> object:
@@ -503,10 +696,35 @@ class MaxRNG:
         idx = self.generate_range(0, len(items))
         return items[idx]
 
+    def choose_many(self, items: List, k: int) -> List:
+        """
+        Choose k random items from a list (with replacement) using a single RNG call.
+
+        Args:
+            items: List of items to choose from
+            k: Number of items to choose
+
+        Returns:
+            List: k randomly selected items
+        """
+        if not items:
+            raise ValueError("List must not be empty")
+        if k < 0:
+            raise ValueError("k must not be negative")
+        if k == 0:
+            return []
+
+        n = len(items)
+        # One 64-bit value per pick; the modulo bias is negligible for any realistic list size
+        return [items[v % n] for v in memoryview(self.generate(8 * k)).cast('Q')]
+
     def shuffle(self, items: List) -> List:
         """
         Shuffle a list in-place using high-quality randomness.
 
+        All the randomness for the Fisher-Yates swaps is drawn with a single RNG call
+        (one 64-bit value per step) instead of one call per element.
+
         Args:
             items: List to shuffle
 
@@ -514,7 +732,11 @@ class MaxRNG:
             List: The shuffled list (same object, modified in-place)
         """
         n = len(items)
-        for i in range(n - 1, 0, -1):
-            j = self.generate_range(0, i + 1)
+        if n < 2:
+            return items
+
+        values = memoryview(self.generate(8 * (n - 1))).cast('Q')
+        for step, i in enumerate(range(n - 1, 0, -1)):
+            j = values[step] % (i + 1)
             items[i], items[j] = items[j], items[i]
         return items
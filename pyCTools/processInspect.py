@@ -1,9 +1,77 @@
 import ctypes
-import json
+import threading
+import time
 from ctypes import c_char_p, c_size_t, c_ulong, create_string_buffer, CFUNCTYPE, c_void_p, c_int
+from typing import Optional, Sequence
 
 from pyCTools._loadDLL import load_dll
 
+# orjson parses the small metric objects several times faster; it is optional, fall back to stdlib
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+
+# Per-thread JSON buffer reused by every ProcessMetrics call on that thread
+_json_tls = threading.local()
+
+
+def _json_buffer(size: int):
+    """Return this thread's JSON string buffer, (re)allocating it only when the size changes."""
+    buf = getattr(_json_tls, "buf", None)
+    if buf is None or len(buf) != size:
+        buf = _json_tls.buf = create_string_buffer(size)
+    return buf
+
+
+class MetricsSnapshot(ctypes.Structure):
+    """
+    Fixed-layout metrics snapshot filled by the DLL's `get_metrics_struct`, mirroring the JSON keys.
+
+    Only the fields selected by the `metrics` bitmask are populated; the others are zero.
+    """
+    _fields_ = [
+        ("pid", c_ulong),
+        ("metrics", c_ulong),
+        ("working_set_kb", ctypes.c_ulonglong),
+        ("private_kb", ctypes.c_ulonglong),
+        ("pagefile_kb", ctypes.c_ulonglong),
+        ("handles", c_ulong),
+        ("threads", c_ulong),
+        ("cpu", ctypes.c_double),
+        ("io_read_kb", ctypes.c_ulonglong),
+        ("io_write_kb", ctypes.c_ulonglong),
+    ]
+
+    # (metric flag, field names) in the order the JSON output lists them
+    _FIELDS_BY_FLAG = (
+        (0x01, ("working_set_kb",)),
+        (0x02, ("private_kb",)),
+        (0x04, ("pagefile_kb",)),
+        (0x08, ("handles",)),
+        (0x10, ("threads",)),
+        (0x20, ("cpu",)),
+        (0x40, ("io_read_kb", "io_write_kb")),
+    )
+
+    def to_dict(self) -> dict:
+        """
+        Convert the snapshot to the same dict `get_snapshot` returns for these metrics.
+
+        Returns:
+            dict: Metrics keyed like the JSON output, with only the requested metrics present.
+        """
+        result = {"pid": self.pid}
+        for flag, names in self._FIELDS_BY_FLAG:
+            if self.metrics & flag:
+                for name in names:
+                    result[name] = getattr(self, name)
+        if "cpu" in result:
+            # The JSON output is printed with two decimals
+            result["cpu"] = round(result["cpu"], 2)
+        return result
+
 
 class ProcessMetrics:
     """
@@ -41,41 +109,92 @@ class ProcessMetrics:
     METRIC_IO = 0x40
     METRIC_NET = 0x80
 
+    # C function types for the per-sample and batched monitoring callbacks
+    _CALLBACK_TYPE = CFUNCTYPE(None, c_char_p, c_void_p)
+    _BATCH_CALLBACK_TYPE = CFUNCTYPE(None, ctypes.POINTER(MetricsSnapshot), c_int, c_void_p)
+
+    # DLL handle with its function signatures already set up, shared by every instance
+    _shared_dll = None
+
+    # Most (pid, metrics) entries get_snapshot keeps for cache_ttl_ms
+    _SNAPSHOT_CACHE_MAX = 256
+
     def __init__(self):
         """
         Initialize ProcessMetrics instance by loading the appropriate DLL
-        for the current platform architecture.
+        for the current platform architecture on first use.
         """
-        # Load the DLL using ctypes
-        self._dll = load_dll(dll_prefix_name="processInspect", dll_load_func=ctypes.CDLL)
+        if ProcessMetrics._shared_dll is None:
+            ProcessMetrics._shared_dll = self._load_dll()
+        self._dll = ProcessMetrics._shared_dll
 
-        # Define argument and return types of DLL functions for type safety
-        self._dll.start_metrics_collection.argtypes = [c_ulong, c_ulong]
-        self._dll.start_metrics_collection.restype = ctypes.c_int
+        # Store callback reference to prevent garbage collection
+        self._callback_ref = None
+        self._batch_callback_ref = None
+        self._user_callback = None
 
-        self._dll.end_metrics_collection.argtypes = [c_ulong, c_ulong, c_char_p, c_size_t]
-        self._dll.end_metrics_collection.restype = ctypes.c_int
+        # Metrics bitmask of each session started through this instance, keyed by PID
+        self._session_metrics = {}
 
-        self._dll.get_metrics_json.argtypes = [c_ulong, c_ulong, c_char_p, c_size_t]
-        self._dll.get_metrics_json.restype = ctypes.c_int
+        # Ring buffer of the buffered monitoring session and how many of its samples were drained
+        self._ring = None
+        self._ring_read = 0
+        # Sample buffer the batched monitoring session fills before each batch callback
+        self._batch_buffer = None
 
-        # Define C function type for the monitoring callback
-        self._CALLBACK_TYPE = CFUNCTYPE(None, c_char_p, c_void_p)
+        # Last get_snapshot result per (pid, metrics) with its monotonic timestamp, for cache_ttl_ms
+        self._snapshot_cache = {}
 
-        # Set types for monitoring functions
-        self._dll.start_metrics_monitoring.argtypes = [c_ulong, c_ulong, c_ulong, c_int,
-                                                       self._CALLBACK_TYPE, c_void_p]
-        self._dll.start_metrics_monitoring.restype = ctypes.c_int
+    @classmethod
+    def _load_dll(cls):
+        """Load the processInspect DLL and define its function signatures."""
+        # Load the DLL using ctypes
+        dll = load_dll(dll_prefix_name="processInspect", dll_load_func=ctypes.CDLL)
 
-        self._dll.stop_metrics_monitoring.argtypes = []
-        self._dll.stop_metrics_monitoring.restype = ctypes.c_int
+        # Define argument and return types of DLL functions for type safety
+        dll.start_metrics_collection.argtypes = [c_ulong, c_ulong]
+        dll.start_metrics_collection.restype = ctypes.c_int
 
-        self._dll.is_metrics_monitoring_active.argtypes = []
-        self._dll.is_metrics_monitoring_active.restype = ctypes.c_int
+        dll.end_metrics_collection.argtypes = [c_ulong, c_ulong, c_char_p, c_size_t]
+        dll.end_metrics_collection.restype = ctypes.c_int
 
-        # Store callback reference to prevent garbage collection
-        self._callback_ref = None
-        self._user_callback = None
+        dll.get_metrics_json.argtypes = [c_ulong, c_ulong, c_char_p, c_size_t]
+        dll.get_metrics_json.restype = ctypes.c_int
+
+        # Set types for monitoring functions
+        dll.start_metrics_monitoring.argtypes = [c_ulong, c_ulong, c_ulong, c_int,
+                                                 cls._CALLBACK_TYPE, c_void_p]
+        dll.start_metrics_monitoring.restype = ctypes.c_int
+
+        dll.stop_metrics_monitoring.argtypes = []
+        dll.stop_metrics_monitoring.restype = ctypes.c_int
+
+        dll.is_metrics_monitoring_active.argtypes = []
+        dll.is_metrics_monitoring_active.restype = ctypes.c_int
+
+        # Struct snapshots are only available in DLL builds that export get_metrics_struct
+        if hasattr(dll, "get_metrics_struct"):
+            dll.get_metrics_struct.argtypes = [c_ulong, c_ulong, ctypes.POINTER(MetricsSnapshot)]
+            dll.get_metrics_struct.restype = ctypes.c_int
+        if hasattr(dll, "get_metrics_burst"):
+            dll.get_metrics_burst.argtypes = [c_ulong, c_ulong, ctypes.POINTER(MetricsSnapshot), c_int, c_ulong]
+            dll.get_metrics_burst.restype = ctypes.c_int
+        if hasattr(dll, "start_metrics_monitoring_buffered"):
+            dll.start_metrics_monitoring_buffered.argtypes = [c_ulong, c_ulong, c_ulong, c_int,
+                                                              ctypes.POINTER(MetricsSnapshot), c_int]
+            dll.start_metrics_monitoring_buffered.restype = ctypes.c_int
+            dll.get_monitoring_sample_count.argtypes = []
+            dll.get_monitoring_sample_count.restype = ctypes.c_long
+        if hasattr(dll, "start_metrics_monitoring_batched"):
+            dll.start_metrics_monitoring_batched.argtypes = [c_ulong, c_ulong, c_ulong, c_int,
+                                                             ctypes.POINTER(MetricsSnapshot), c_int,
+                                                             cls._BATCH_CALLBACK_TYPE, c_void_p]
+            dll.start_metrics_monitoring_batched.restype = ctypes.c_int
+        if hasattr(dll, "get_metrics_batch"):
+            dll.get_metrics_batch.argtypes = [ctypes.POINTER(c_ulong), c_int, c_ulong, ctypes.POINTER(MetricsSnapshot),
+                                              ctypes.POINTER(c_int)]
+            dll.get_metrics_batch.restype = ctypes.c_int
+        return dll
 
     @staticmethod
     def _json_call(func, pid: int, metrics: int, _buffer_size: int = 4096) -> dict:
@@ -95,11 +214,12 @@ class ProcessMetrics:
         Raises:
             RuntimeError: If the DLL function call returns failure.
         """
-        buf = create_string_buffer(_buffer_size)  # buffer size fixed to 4 KB
-        success = func(pid, metrics, buf, ctypes.sizeof(buf))
+        buf = _json_buffer(_buffer_size)  # buffer size fixed to 4 KB, reused per thread
+        success = func(pid, metrics, buf, _buffer_size)
         if not success:
             raise RuntimeError(f"Metric collection failed for PID {pid}")
-        return json.loads(buf.value.decode('utf-8'))
+        # Both parsers take UTF-8 bytes directly, so skip the intermediate str copy
+        return _json_loads(buf.value)
 
     def start_session(self, pid: int, metrics: int) -> bool:
         """
@@ -112,33 +232,191 @@ class ProcessMetrics:
         Returns:
             bool: True if session started successfully, False otherwise.
         """
-        return bool(self._dll.start_metrics_collection(pid, metrics))
+        started = bool(self._dll.start_metrics_collection(pid, metrics))
+        if started:
+            self._session_metrics[pid] = metrics
+        return started
 
-    def end_session(self, pid: int, metrics: int) -> dict:
+    def end_session(self, pid: int, metrics: Optional[int] = None) -> dict:
         """
         End a previously started metrics collection session and retrieve results.
 
         Args:
             pid (int): Process ID of the session.
-            metrics (int): Bitmask of metrics to retrieve.
+            metrics (Optional[int]): Bitmask of metrics to retrieve. Defaults to the
+                bitmask the session was started with on this instance.
 
         Returns:
             dict: Metrics collected during the session.
+
+        Raises:
+            ValueError: If metrics is omitted and no session was started for pid.
+            RuntimeError: If the DLL function call fails.
         """
-        return self._json_call(self._dll.end_metrics_collection, pid, metrics)
+        if metrics is None:
+            if pid not in self._session_metrics:
+                raise ValueError(f"No session started for PID {pid}, pass metrics explicitly")
+            metrics = self._session_metrics[pid]
+        result = self._json_call(self._dll.end_metrics_collection, pid, metrics)
+        self._session_metrics.pop(pid, None)
+        return result
 
-    def get_snapshot(self, pid: int, metrics: int) -> dict:
+    def get_snapshot(self, pid: int, metrics: int, cache_ttl_ms: int = 0) -> dict:
         """
         Retrieve an instant snapshot of metrics for a process without starting a session.
 
         Args:
             pid (int): Process ID to query.
             metrics (int): Bitmask of metrics to retrieve.
+            cache_ttl_ms (int): If positive, a snapshot of the same (pid, metrics) taken
+                through this instance less than this many milliseconds ago is returned
+                instead of querying the DLL again (default 0, always query). At most
+                256 entries are kept; expired and then the oldest ones are evicted.
 
         Returns:
             dict: Current metrics snapshot.
         """
-        return self._json_call(self._dll.get_metrics_json, pid, metrics)
+        if cache_ttl_ms <= 0:
+            return self._json_call(self._dll.get_metrics_json, pid, metrics)
+
+        ttl = cache_ttl_ms / 1000
+        key = (pid, metrics)
+        cache = self._snapshot_cache
+        cached = cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return dict(cached[1])
+
+        snapshot = self._json_call(self._dll.get_metrics_json, pid, metrics)
+        # Stamped after the call, so the entry's age counts from when the data was taken
+        now = time.monotonic()
+        # Re-inserting keeps the dict ordered oldest first. When it is full, expired entries are
+        # evicted, then the oldest ones, so walking many PIDs cannot grow it without bound
+        cache.pop(key, None)
+        if len(cache) >= self._SNAPSHOT_CACHE_MAX:
+            for old_key in [k for k, (stamp, _) in cache.items() if now - stamp >= ttl]:
+                del cache[old_key]
+            while len(cache) >= self._SNAPSHOT_CACHE_MAX:
+                del cache[next(iter(cache))]
+        cache[key] = (now, snapshot)
+        return dict(snapshot)
+
+    def snapshot_into(self, pid: int, metrics: int, out: dict) -> dict:
+        """
+        Retrieve an instant snapshot of metrics into an existing dict.
+
+        Meant for polling loops: `out` is updated in place instead of a new dict
+        being returned. Keys from earlier calls with other metrics are kept.
+
+        Args:
+            pid (int): Process ID to query.
+            metrics (int): Bitmask of metrics to retrieve.
+            out (dict): Dict to update with the current metrics.
+
+        Returns:
+            dict: `out`, updated with the current metrics snapshot.
+
+        Raises:
+            RuntimeError: If metric collection fails.
+        """
+        out.update(self._json_call(self._dll.get_metrics_json, pid, metrics))
+        return out
+
+    def get_snapshot_struct(self, pid: int, metrics: int) -> MetricsSnapshot:
+        """
+        Retrieve an instant snapshot of metrics as a `MetricsSnapshot` structure.
+
+        Same data as `get_snapshot`, but copied straight into a ctypes structure
+        instead of being formatted as JSON and parsed back, which is cheaper for
+        high-frequency polling. Use `MetricsSnapshot.to_dict()` for a dict.
+
+        Args:
+            pid (int): Process ID to query.
+            metrics (int): Bitmask of metrics to retrieve.
+
+        Returns:
+            MetricsSnapshot: Current metrics snapshot.
+
+        Raises:
+            RuntimeError: If the loaded DLL does not export `get_metrics_struct`
+                or if metric collection fails.
+        """
+        if not hasattr(self._dll, "get_metrics_struct"):
+            raise RuntimeError("The loaded processInspect DLL does not support struct snapshots, rebuild it")
+        snap = MetricsSnapshot()
+        if not self._dll.get_metrics_struct(pid, metrics, ctypes.byref(snap)):
+            raise RuntimeError(f"Metric collection failed for PID {pid}")
+        return snap
+
+    def get_snapshot_burst(self, pid: int, metrics: int, count: int, interval_ms: int = 0) -> list:
+        """
+        Take several snapshots in one DLL call.
+
+        The sampling loop runs inside the DLL, so high-frequency polling crosses
+        the Python/C boundary once per burst instead of once per sample.
+
+        CPU usage is measured between consecutive samples of the burst, so the
+        first sample has no `cpu` value: it is 0 and `METRIC_CPU_USAGE` is
+        cleared from that sample's `metrics`.
+
+        Args:
+            pid (int): Process ID to query.
+            metrics (int): Bitmask of metrics to retrieve.
+            count (int): Number of snapshots to take.
+            interval_ms (int): Delay between snapshots in milliseconds (default 0).
+
+        Returns:
+            list: `MetricsSnapshot` structures in sampling order. May be shorter than
+                `count` if sampling failed part way through.
+
+        Raises:
+            ValueError: If count is not positive or interval_ms is negative.
+            RuntimeError: If the loaded DLL does not export `get_metrics_burst`
+                or if no snapshot could be taken.
+        """
+        if count <= 0:
+            raise ValueError("count must be positive")
+        if interval_ms < 0:
+            raise ValueError("interval_ms must not be negative")
+        if not hasattr(self._dll, "get_metrics_burst"):
+            raise RuntimeError("The loaded processInspect DLL does not support burst snapshots, rebuild it")
+        samples = (MetricsSnapshot * count)()
+        collected = self._dll.get_metrics_burst(pid, metrics, samples, count, interval_ms)
+        if collected <= 0:
+            raise RuntimeError(f"Metric collection failed for PID {pid}")
+        return samples[:collected]
+
+    def get_snapshot_batch(self, pids: Sequence[int], metrics: int) -> list:
+        """
+        Snapshot several processes in one DLL call.
+
+        The DLL creates one system process snapshot for the whole batch instead
+        of one per PID (each PID still scans it for its thread count), and the
+        Python/C boundary is crossed a single time.
+
+        CPU usage needs an earlier sample of the same process, so batch entries
+        never report it: `cpu` is 0 and `METRIC_CPU_USAGE` is cleared from every
+        entry's `metrics`. Use `get_snapshot_burst` or monitoring for CPU usage.
+
+        Args:
+            pids (Sequence[int]): Process IDs to query.
+            metrics (int): Bitmask of metrics to retrieve.
+
+        Returns:
+            list: One entry per PID, in the same order. Each entry is a
+                `MetricsSnapshot`, or None if that process could not be queried.
+
+        Raises:
+            RuntimeError: If the loaded DLL does not export `get_metrics_batch`.
+        """
+        if not pids:
+            return []
+        if not hasattr(self._dll, "get_metrics_batch"):
+            raise RuntimeError("The loaded processInspect DLL does not support batch snapshots, rebuild it")
+        count = len(pids)
+        samples = (MetricsSnapshot * count)()
+        status = (c_int * count)()
+        self._dll.get_metrics_batch((c_ulong * count)(*pids), count, metrics, samples, status)
+        return [snap if ok else None for snap, ok in zip(samples, status)]
 
     # noinspection PyUnusedLocal
     def _callback_wrapper(self, json_str, user_data):
@@ -147,15 +425,30 @@ class ProcessMetrics:
         and calls the user's callback function.
 
         Args:
-            json_str (c_char_p): JSON metrics data from C.
+            json_str (bytes): JSON metrics data from C, converted by ctypes.
             user_data (c_void_p): User data pointer (unused in this implementation).
         """
         if self._user_callback:
-            metrics_dict = json.loads(ctypes.string_at(json_str).decode('utf-8'))
+            # ctypes already hands c_char_p callback arguments over as bytes, parse them as-is
+            metrics_dict = _json_loads(json_str)
             self._user_callback(metrics_dict)
 
+    # noinspection PyUnusedLocal
+    def _batch_callback_wrapper(self, samples, count, user_data):
+        """
+        Internal callback wrapper that converts a batch of C snapshots to a list
+        of dicts and calls the user's callback function once for the whole batch.
+
+        Args:
+            samples (POINTER(MetricsSnapshot)): Batch of snapshots from C.
+            count (int): Number of valid snapshots in the batch.
+            user_data (c_void_p): User data pointer (unused in this implementation).
+        """
+        if self._user_callback:
+            self._user_callback([samples[i].to_dict() for i in range(count)])
+
     def start_monitoring(self, pid: int, metrics: int, interval_ms: int,
-                         duration_ms: int = -1, callback=None) -> bool:
+                         duration_ms: int = -1, callback=None, batch_size: int = 1) -> bool:
         """
         Start continuous monitoring of a process at specified intervals.
 
@@ -166,24 +459,120 @@ class ProcessMetrics:
             duration_ms (int): Total duration to monitor in milliseconds. Use -1 for
                                indefinite monitoring until explicitly stopped.
             callback (callable): Function to call with each metrics update.
-                                The callback receives a dict of the parsed metrics.
+                                The callback receives a dict of the parsed metrics,
+                                or a list of such dicts when batch_size > 1.
+            batch_size (int): Number of samples the DLL collects before calling back once
+                              with all of them (default 1, one callback per sample).
 
         Returns:
             bool: True if monitoring started successfully, False otherwise.
+
+        Raises:
+            ValueError: If batch_size is not positive, or is above 1 without a callback.
+            RuntimeError: If batch_size > 1 and the loaded DLL does not export
+                `start_metrics_monitoring_batched`.
         """
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+        if batch_size > 1 and not callback:
+            raise ValueError("batch_size > 1 requires a callback")
+        if batch_size > 1 and not hasattr(self._dll, "start_metrics_monitoring_batched"):
+            raise RuntimeError("The loaded processInspect DLL does not support batched monitoring, rebuild it")
         if self.is_monitoring_active():
             return False
 
         self._user_callback = callback
 
-        # Create C-compatible callback function
-        if callback:
+        if batch_size > 1:
+            if self._batch_callback_ref is None:
+                self._batch_callback_ref = self._BATCH_CALLBACK_TYPE(self._batch_callback_wrapper)
+            # Held on the instance so the DLL thread can keep filling it until the next session. Kept apart
+            # from the buffered-mode ring so drain_samples() never reads batch slots as ring samples, and
+            # only replaced once the DLL accepted the new session (a refused start leaves the old one in use)
+            batch = (MetricsSnapshot * batch_size)()
+            if not self._dll.start_metrics_monitoring_batched(
+                    pid, metrics, interval_ms, duration_ms, batch, batch_size, self._batch_callback_ref, None):
+                return False
+            self._batch_buffer = batch
+            return True
+
+        # The C trampoline only forwards to _callback_wrapper, so it is built once and kept for reuse
+        # (and stays valid even if the native thread fires one last callback after stopping)
+        if callback and self._callback_ref is None:
             self._callback_ref = self._CALLBACK_TYPE(self._callback_wrapper)
-        else:
-            self._callback_ref = None
 
         return bool(self._dll.start_metrics_monitoring(
-            pid, metrics, interval_ms, duration_ms, self._callback_ref, None))
+            pid, metrics, interval_ms, duration_ms, self._callback_ref if callback else None, None))
+
+    def start_monitoring_buffered(self, pid: int, metrics: int, interval_ms: int,
+                                  duration_ms: int = -1, capacity: int = 1024) -> bool:
+        """
+        Start continuous monitoring that stores samples in a ring buffer instead of calling back.
+
+        The DLL thread writes each sample as a `MetricsSnapshot` without touching
+        Python, so sampling never waits on the GIL. Collect the samples with
+        `drain_samples()` at whatever pace suits the caller, and stop the session
+        with `stop_monitoring()`.
+
+        Args:
+            pid (int): Process ID to monitor.
+            metrics (int): Bitmask of metrics to collect (use class flags).
+            interval_ms (int): Interval between metric collections in milliseconds.
+            duration_ms (int): Total duration to monitor in milliseconds. Use -1 for
+                               indefinite monitoring until explicitly stopped.
+            capacity (int): Number of samples the ring holds, at least 2; older samples
+                            are overwritten if they are not drained in time (default 1024).
+
+        Returns:
+            bool: True if monitoring started successfully, False otherwise.
+
+        Raises:
+            ValueError: If capacity is less than 2.
+            RuntimeError: If the loaded DLL does not export `start_metrics_monitoring_buffered`.
+        """
+        # One slot is always being written next, so a single-slot ring could never be drained
+        if capacity < 2:
+            raise ValueError("capacity must be at least 2")
+        if not hasattr(self._dll, "start_metrics_monitoring_buffered"):
+            raise RuntimeError("The loaded processInspect DLL does not support buffered monitoring, rebuild it")
+        if self.is_monitoring_active():
+            return False
+
+        # Held on the instance so the DLL thread can keep writing to it until the next session
+        ring = (MetricsSnapshot * capacity)()
+        if not self._dll.start_metrics_monitoring_buffered(pid, metrics, interval_ms, duration_ms, ring, capacity):
+            return False
+        self._ring = ring
+        self._ring_read = 0
+        return True
+
+    def drain_samples(self) -> list:
+        """
+        Return the samples written by the buffered monitoring session since the last drain.
+
+        Works while the session is running and after it has stopped. If more than
+        `capacity - 1` samples arrived since the last drain only the newest ones are
+        still available. The slot the writer fills next is never read, and samples the
+        writer overtook while they were being copied are dropped after re-reading the
+        sample count, so no returned sample is torn.
+
+        Returns:
+            list: `MetricsSnapshot` copies in sampling order (empty if there is nothing new
+                or no buffered session was started).
+        """
+        ring = self._ring
+        if ring is None:
+            return []
+        written = self._dll.get_monitoring_sample_count()
+        capacity = len(ring)
+        start = max(self._ring_read, written - capacity + 1)
+        samples = [MetricsSnapshot.from_buffer_copy(ring[i % capacity]) for i in range(start, written)]
+        self._ring_read = written
+
+        # Sample i shares its slot with sample i + capacity, so anything at or below
+        # (count now) - capacity may have been rewritten while it was copied
+        overtaken = self._dll.get_monitoring_sample_count() - capacity + 1 - start
+        return samples[overtaken:] if overtaken > 0 else samples
 
     def stop_monitoring(self) -> bool:
         """
@@ -195,7 +584,6 @@ class ProcessMetrics:
         result = bool(self._dll.stop_metrics_monitoring())
         if result:
             self._user_callback = None
-            self._callback_ref = None
         return result
 
     def is_monitoring_active(self) -> bool:
@@ -7,7 +7,7 @@ try:
     # noinspection PyUnusedImports
     from setuptools.command.bdist_wheel import bdist_wheel as _bdist_wheel
     # noinspection PyUnusedImports
-    from setuptools import setup, find_packages
+    from setuptools import setup
     import wheel
 except ImportError:
     sys.exit(
@@ -16,6 +16,19 @@ except ImportError:
     )
 
 
+# VERSION = "x.y.z" line in pyCTools/__init__.py
+_VERSION_RE = re.compile(r'^VERSION\s*=\s*[\'"]([^\'"]*)[\'"]', re.MULTILINE)
+
+
+def _has_dll(path: str) -> bool:
+    """Return True as soon as a .dll file is found in path (False if path is missing)."""
+    try:
+        with os.scandir(path) as entries:
+            return any(e.name.lower().endswith(".dll") and e.is_file() for e in entries)
+    except FileNotFoundError:
+        return False
+
+
 def check_bin_exists(bin_path: str):
     try:
         # Check that bin exists and has x86 & x64 DLLs
@@ -28,7 +41,7 @@ def check_bin_exists(bin_path: str):
         # Check subfolders and DLL presence
         for arch in ("x86", "x64"):
             arch_path = os.path.join(bin_path, arch)
-            if not os.path.isdir(arch_path) or not any(f.lower().endswith(".dll") for f in os.listdir(arch_path)):
+            if not _has_dll(arch_path):
                 sys.exit(
                     f"[x] Missing DLLs in pyCTools/bin/{arch}/\n"
                     "        Suggested action: Run 'compilerHelper.ps1' to generate the DLLs before building.\n"
@@ -63,11 +76,10 @@ def get_version() -> str:
     try:
         here = os.path.abspath(os.path.dirname(__file__))
         init_path = os.path.join(here, "pyCTools", "__init__.py")
-        version_regex = r'^VERSION\s*=\s*[\'"]([^\'"]*)[\'"]'
 
         with open(init_path, "r", encoding="utf-8") as f:
             content = f.read()
-        match = re.search(version_regex, content, re.MULTILINE)
+        match = _VERSION_RE.search(content)
         if match:
             return match.group(1)
         else:
@@ -92,7 +104,8 @@ if __name__ == "__main__":
         setup(
             name="pyCTools",
             version=VERSION,
-            packages=find_packages() + ["pyCTools.bin.x64", "pyCTools.bin.x86"],
+            # Listed explicitly, the package set is fixed and find_packages() would walk the whole tree
+            packages=["pyCTools", "pyCTools.bin.x64", "pyCTools.bin.x86"],
             include_package_data=True,
             package_data={
                 "pyCTools": ["bin/x86/*.dll", "bin/x64/*.dll"],
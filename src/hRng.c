@@ -264,6 +264,31 @@ static DWORD algo_digest_len(const RNG_HASH_ALGO a) {
     }
 }
 
+// Algorithm providers are expensive to open and may be shared between threads, so each
+// (algorithm, HMAC flag) pair is opened once on first use and kept for the life of the process
+static BCRYPT_ALG_HANDLE volatile g_algProviders[3][2] = {{0}};
+
+static BCRYPT_ALG_HANDLE get_alg_provider(const RNG_HASH_ALGO a, const int hmac) {
+    const int idx = (a == RNG_HASH_SHA512) ? 1 : (a == RNG_HASH_SHA1) ? 2 : 0;
+    BCRYPT_ALG_HANDLE volatile *slot = &g_algProviders[idx][hmac ? 1 : 0];
+
+    BCRYPT_ALG_HANDLE hAlg = *slot;
+    if (hAlg) return hAlg;
+
+    if (!BCRYPT_SUCCESS(BCryptOpenAlgorithmProvider(&hAlg, algo_name_from_enum(a), NULL,
+                                                    hmac ? BCRYPT_ALG_HANDLE_HMAC_FLAG : 0))) {
+        return NULL;
+    }
+    // Another thread may have won the race, keep its handle and drop ours
+    // ReSharper disable once CppLocalVariableMayBeConst
+    BCRYPT_ALG_HANDLE prev = InterlockedCompareExchangePointer((PVOID volatile *)slot, hAlg, NULL);
+    if (prev) {
+        BCryptCloseAlgorithmProvider(hAlg, 0);
+        return prev;
+    }
+    return hAlg;
+}
+
 // ============================================================
 // Base64 and hex utilities
 // ============================================================
@@ -325,22 +350,22 @@ static int hmac_once(const RNG_HASH_ALGO algo,
     BCRYPT_HASH_HANDLE hHash = NULL;
     DWORD cbHash = 0, cbData = 0;
 
-    NTSTATUS s = BCryptOpenAlgorithmProvider(&hAlg, algo_name_from_enum(algo), NULL,
-                                             BCRYPT_ALG_HANDLE_HMAC_FLAG);
-    if (!BCRYPT_SUCCESS(s)) return 0;
+    hAlg = get_alg_provider(algo, 1);
+    if (!hAlg) return 0;
+
+    NTSTATUS s;
 
     s = BCryptGetProperty(hAlg, BCRYPT_HASH_LENGTH, (PUCHAR)&cbHash, sizeof(cbHash), &cbData, 0);
-    if (!BCRYPT_SUCCESS(s) || cbHash != out_len) { BCryptCloseAlgorithmProvider(hAlg, 0); return 0; }
+    if (!BCRYPT_SUCCESS(s) || cbHash != out_len) return 0;
 
     s = BCryptCreateHash(hAlg, &hHash, NULL, 0, (PUCHAR)key, key_len, 0);
-    if (!BCRYPT_SUCCESS(s)) { BCryptCloseAlgorithmProvider(hAlg, 0); return 0; }
+    if (!BCRYPT_SUCCESS(s)) return 0;
 
     s = BCryptHashData(hHash, (PUCHAR)msg, msg_len, 0);
-    if (!BCRYPT_SUCCESS(s)) { BCryptDestroyHash(hHash); BCryptCloseAlgorithmProvider(hAlg, 0); return 0; }
+    if (!BCRYPT_SUCCESS(s)) { BCryptDestroyHash(hHash); return 0; }
 
     s = BCryptFinishHash(hHash, out, cbHash, 0);
     BCryptDestroyHash(hHash);
-    BCryptCloseAlgorithmProvider(hAlg, 0);
     return BCRYPT_SUCCESS(s) ? 1 : 0;
 }
 
@@ -461,45 +486,45 @@ static int collect_entropy_configurable(unsigned char *buffer, const int size, c
     const DWORD H = algo_digest_len(algo);
     unsigned char digest[64];
 
-    NTSTATUS status = BCryptOpenAlgorithmProvider(&hAlg, algo_name_from_enum(algo), NULL, 0);
-    if (!BCRYPT_SUCCESS(status)) return 0;
+    hAlg = get_alg_provider(algo, 0);
+    if (!hAlg) return 0;
+
+    NTSTATUS status;
 
     status = BCryptGetProperty(hAlg, BCRYPT_HASH_LENGTH, (PUCHAR)&cbHash, sizeof(cbHash), &cbData, 0);
-    if (!BCRYPT_SUCCESS(status) || cbHash != H) { BCryptCloseAlgorithmProvider(hAlg, 0); return 0; }
+    if (!BCRYPT_SUCCESS(status) || cbHash != H) return 0;
 
     if (mixing == RNG_MIX_CONTINUOUS) {
         // One long-running hash
         status = BCryptCreateHash(hAlg, &hHash, NULL, 0, NULL, 0, 0);
-        if (!BCRYPT_SUCCESS(status)) { BCryptCloseAlgorithmProvider(hAlg, 0); return 0; }
+        if (!BCRYPT_SUCCESS(status)) return 0;
 
         for (int i = 0; i < rounds; i++) {
             hash_update_entropy_from_sources(hHash, cfg);
         }
         status = BCryptFinishHash(hHash, digest, cbHash, 0);
         BCryptDestroyHash(hHash);
-        if (!BCRYPT_SUCCESS(status)) { BCryptCloseAlgorithmProvider(hAlg, 0); return 0; }
+        if (!BCRYPT_SUCCESS(status)) return 0;
     } else {
         // Round-based finalize then feed digest into next round
         status = BCryptCreateHash(hAlg, &hHash, NULL, 0, NULL, 0, 0);
-        if (!BCRYPT_SUCCESS(status)) { BCryptCloseAlgorithmProvider(hAlg, 0); return 0; }
+        if (!BCRYPT_SUCCESS(status)) return 0;
 
         for (int round = 0; round < rounds; round++) {
             hash_update_entropy_from_sources(hHash, cfg);
             status = BCryptFinishHash(hHash, digest, cbHash, 0);
             if (!BCRYPT_SUCCESS(status)) {
                 BCryptDestroyHash(hHash);
-                BCryptCloseAlgorithmProvider(hAlg, 0);
                 return 0;
             }
             if (round + 1 < rounds) {
                 BCryptDestroyHash(hHash);
                 status = BCryptCreateHash(hAlg, &hHash, NULL, 0, NULL, 0, 0);
-                if (!BCRYPT_SUCCESS(status)) { BCryptCloseAlgorithmProvider(hAlg, 0); return 0; }
+                if (!BCRYPT_SUCCESS(status)) return 0;
                 // feed prior digest to new round
                 const NTSTATUS s2 = BCryptHashData(hHash, digest, cbHash, 0);
                 if (!BCRYPT_SUCCESS(s2)) {
                     BCryptDestroyHash(hHash);
-                    BCryptCloseAlgorithmProvider(hAlg, 0);
                     return 0;
                 }
             }
@@ -520,17 +545,17 @@ static int collect_entropy_configurable(unsigned char *buffer, const int size, c
         while (bytesRemaining > 0) {
             BCRYPT_HASH_HANDLE hH = NULL;
             status = BCryptCreateHash(hAlg, &hH, NULL, 0, NULL, 0, 0);
-            if (!BCRYPT_SUCCESS(status)) { BCryptCloseAlgorithmProvider(hAlg, 0); return 0; }
+            if (!BCRYPT_SUCCESS(status)) return 0;
 
             status = BCryptHashData(hH, digest, cbHash, 0);
-            if (!BCRYPT_SUCCESS(status)) { BCryptDestroyHash(hH); BCryptCloseAlgorithmProvider(hAlg, 0); return 0; }
+            if (!BCRYPT_SUCCESS(status)) { BCryptDestroyHash(hH); return 0; }
 
             status = BCryptHashData(hH, (PUCHAR)&counter, sizeof(counter), 0);
-            if (!BCRYPT_SUCCESS(status)) { BCryptDestroyHash(hH); BCryptCloseAlgorithmProvider(hAlg, 0); return 0; }
+            if (!BCRYPT_SUCCESS(status)) { BCryptDestroyHash(hH); return 0; }
 
             status = BCryptFinishHash(hH, digest, cbHash, 0);
             BCryptDestroyHash(hH);
-            if (!BCRYPT_SUCCESS(status)) { BCryptCloseAlgorithmProvider(hAlg, 0); return 0; }
+            if (!BCRYPT_SUCCESS(status)) return 0;
 
             bytesToCopy = (bytesRemaining < cbHash) ? bytesRemaining : cbHash;
             memcpy(buffer + offset, digest, bytesToCopy);
@@ -540,7 +565,6 @@ static int collect_entropy_configurable(unsigned char *buffer, const int size, c
         }
     }
 
-    BCryptCloseAlgorithmProvider(hAlg, 0);
     SecureZeroMemory(digest, sizeof(digest));
     return 1;
 }
@@ -619,38 +643,39 @@ static int expand_output(const RNG_CONFIG *cfg,
             uint32_t ctr = 1;
             int pos = 0;
 
-            NTSTATUS s = BCryptOpenAlgorithmProvider(&hAlg, algo_name_from_enum(algo), NULL, 0);
-            if (!BCRYPT_SUCCESS(s)) return 0;
+            hAlg = get_alg_provider(algo, 0);
+            if (!hAlg) return 0;
+
+            NTSTATUS s;
 
             s = BCryptGetProperty(hAlg, BCRYPT_HASH_LENGTH, (PUCHAR)&cbHash, sizeof(cbHash), &cbData, 0);
-            if (!BCRYPT_SUCCESS(s) || cbHash != H) { BCryptCloseAlgorithmProvider(hAlg, 0); return 0; }
+            if (!BCRYPT_SUCCESS(s) || cbHash != H) return 0;
 
             while (pos < out_len) {
                 s = BCryptCreateHash(hAlg, &hH, NULL, 0, NULL, 0, 0);
-                if (!BCRYPT_SUCCESS(s)) { BCryptCloseAlgorithmProvider(hAlg, 0); return 0; }
+                if (!BCRYPT_SUCCESS(s)) return 0;
 
                 s = BCryptHashData(hH, (PUCHAR)ikm, ikm_len, 0);
-                if (!BCRYPT_SUCCESS(s)) { BCryptDestroyHash(hH); BCryptCloseAlgorithmProvider(hAlg, 0); return 0; }
+                if (!BCRYPT_SUCCESS(s)) { BCryptDestroyHash(hH); return 0; }
 
                 if (cfg->seed && cfg->seed_len > 0) {
                     // fold seed for domain separation
                     s = BCryptHashData(hH, (PUCHAR)cfg->seed, cfg->seed_len, 0);
-                    if (!BCRYPT_SUCCESS(s)) { BCryptDestroyHash(hH); BCryptCloseAlgorithmProvider(hAlg, 0); return 0; }
+                    if (!BCRYPT_SUCCESS(s)) { BCryptDestroyHash(hH); return 0; }
                 }
 
                 s = BCryptHashData(hH, (PUCHAR)&ctr, sizeof(ctr), 0);
-                if (!BCRYPT_SUCCESS(s)) { BCryptDestroyHash(hH); BCryptCloseAlgorithmProvider(hAlg, 0); return 0; }
+                if (!BCRYPT_SUCCESS(s)) { BCryptDestroyHash(hH); return 0; }
 
                 s = BCryptFinishHash(hH, block, H, 0);
                 BCryptDestroyHash(hH);
-                if (!BCRYPT_SUCCESS(s)) { BCryptCloseAlgorithmProvider(hAlg, 0); return 0; }
+                if (!BCRYPT_SUCCESS(s)) return 0;
 
                 const int to_copy = (out_len - pos < (int)H) ? (out_len - pos) : (int)H;
                 memcpy(out_raw + pos, block, to_copy);
                 pos += to_copy;
                 ctr++;
             }
-            BCryptCloseAlgorithmProvider(hAlg, 0);
             SecureZeroMemory(block, sizeof(block));
             return 1;
         }
@@ -704,6 +729,20 @@ __declspec(dllexport) int test_threading_available(void) {
     return InterlockedCompareExchange(&g_threadingInitialized, 0, 0) != 0 ? 1 : 0;
 }
 
+// Direct RDRAND draw with no entropy mixing or hashing, for callers that only need a few bytes
+// Returns 1 and stores 64 bits in *out on success, 0 if RDRAND is unavailable or keeps failing
+__declspec(dllexport) int rdrand64(uint64_t *out) {
+    static volatile LONG supported = -1;
+    if (!out) return 0;
+    if (supported < 0) supported = rdrand_supported() ? 1 : 0;
+    if (!supported) return 0;
+
+    uint32_t lo, hi;
+    if (!rdrand32_retry(&lo) || !rdrand32_retry(&hi)) return 0;
+    *out = ((uint64_t)hi << 32) | lo;
+    return 1;
+}
+
 // Basic RNG, complexity 1
 __declspec(dllexport) int maxrng(unsigned char *buffer, const int size) {
     if (!buffer || size <= 0) return 0;
@@ -751,12 +790,13 @@ __declspec(dllexport) void maxrng_init(void) {
     }
 }
 
-// Thread-safe version, uses critical section lock, with optional complexity param (default 1)
+// Thread-safe version with optional complexity param (default 1). Lock-free: concurrent calls run in
+// parallel, but maxrng_init() must have been called first, otherwise it returns 0
 __declspec(dllexport) int maxrng_threadsafe(unsigned char *buffer, const int size, int complexity) {
     if (!buffer || size <= 0) return 0;
     if (complexity < 1) complexity = 1;
     if (complexity > 5) complexity = 5;
-    EnterCriticalSection(&g_rngLock);
+    if (!InterlockedCompareExchange(&g_threadingInitialized, 0, 0)) return 0;
 
     RNG_CONFIG cfg = {0};
     cfg.use_cpu = cfg.use_memory = cfg.use_perf = cfg.use_disk =
@@ -765,14 +805,14 @@ __declspec(dllexport) int maxrng_threadsafe(unsigned char *buffer, const int siz
     cfg.hash_algo = RNG_HASH_SHA256;
     cfg.mixing = RNG_MIX_CONTINUOUS;
     cfg.expansion = RNG_EXP_COUNTER;
-    cfg.threading = RNG_THREAD_CRITSEC;
+    cfg.threading = RNG_THREAD_NONE;
     cfg.sec_mode = RNG_MODE_BALANCED;
     cfg.complexity = complexity;
     cfg.output_mode = RNG_OUT_RAW;
 
-    const int result = collect_entropy_configurable(buffer, size, complexity, cfg.hash_algo, cfg.mixing, &cfg);
-    LeaveCriticalSection(&g_rngLock);
-    return result;
+    // All state lives on this call's stack and in its own BCrypt hash objects (the shared algorithm
+    // providers are thread-safe), so concurrent callers no longer serialize on g_rngLock
+    return collect_entropy_configurable(buffer, size, complexity, cfg.hash_algo, cfg.mixing, &cfg);
 }
 
 // Core DEV RNG with configurable options
@@ -26,6 +26,21 @@ typedef struct {
     int active;
 } MetricsSession;
 
+// Fixed-layout snapshot returned by get_metrics_struct, mirrors the JSON keys.
+// Only the fields selected by `metrics` are filled, the rest stay zero.
+typedef struct {
+    DWORD pid;
+    DWORD metrics;
+    ULONGLONG working_set_kb;
+    ULONGLONG private_kb;
+    ULONGLONG pagefile_kb;
+    DWORD handles;
+    DWORD threads;
+    double cpu;
+    ULONGLONG io_read_kb;
+    ULONGLONG io_write_kb;
+} MetricsSnapshot;
+
 // Structure for the monitoring thread
 typedef struct {
     DWORD pid;
@@ -34,8 +49,16 @@ typedef struct {
     int totalDurationMs;   // -1 means run until explicitly stopped
     int isRunning;
     HANDLE threadHandle;
+    DWORD threadId;
+    HANDLE stopEvent;      // manual-reset, set by stop_metrics_monitoring to cut the interval wait short
     void (*callbackFn)(const char*, void*);
     void* userData;
+    // Buffered mode: samples go into a caller-owned ring instead of the callback
+    MetricsSnapshot* ring;
+    int ringCapacity;
+    volatile LONG ringWritten;  // total samples written, the next slot is ringWritten % ringCapacity
+    // Batched mode: the ring is handed to this callback each time it fills up
+    void (*batchCallbackFn)(const MetricsSnapshot*, int, void*);
 } MonitoringContext;
 
 static MetricsSession g_session = {0};
@@ -48,34 +71,43 @@ static ULONGLONG fileTimeToInt(const FILETIME ft) {
     return ui.QuadPart;
 }
 
-// ReSharper disable once CppParameterMayBeConst
-double get_cpu_usage(HANDLE hProcess) {
-    static FILETIME lastSysKernel = {0}, lastSysUser = {0};
-    static ULONGLONG lastProcKernel = 0, lastProcUser = 0;
+// Previous CPU time sample of one process, CPU usage is the delta against it
+typedef struct {
+    ULONGLONG sysTime;   // system kernel + user time
+    ULONGLONG procTime;  // process kernel + user time
+    int valid;           // 0 until a first sample has been stored
+} CpuTimes;
 
+// ReSharper disable once CppParameterMayBeConst
+static double cpu_usage_since(HANDLE hProcess, CpuTimes *prev) {
     FILETIME sysIdle, sysKernel, sysUser;
     FILETIME procCreation, procExit, procKernel, procUser;
 
     if (!GetSystemTimes(&sysIdle, &sysKernel, &sysUser)) return 0.0;
     if (!GetProcessTimes(hProcess, &procCreation, &procExit, &procKernel, &procUser)) return 0.0;
 
-    const ULONGLONG sysKernelInt = fileTimeToInt(sysKernel);
-    const ULONGLONG sysUserInt = fileTimeToInt(sysUser);
-    const ULONGLONG procKernelInt = fileTimeToInt(procKernel);
-    const ULONGLONG procUserInt = fileTimeToInt(procUser);
+    const ULONGLONG sysTime = fileTimeToInt(sysKernel) + fileTimeToInt(sysUser);
+    const ULONGLONG procTime = fileTimeToInt(procKernel) + fileTimeToInt(procUser);
 
-    const ULONGLONG sysDelta = (sysKernelInt + sysUserInt) - (fileTimeToInt(lastSysKernel) + fileTimeToInt(lastSysUser));
-    const ULONGLONG procDelta = (procKernelInt + procUserInt) - (lastProcKernel + lastProcUser);
+    const ULONGLONG sysDelta = sysTime - prev->sysTime;
+    const ULONGLONG procDelta = procTime - prev->procTime;
 
-    lastSysKernel = sysKernel;
-    lastSysUser = sysUser;
-    lastProcKernel = procKernelInt;
-    lastProcUser = procUserInt;
+    prev->sysTime = sysTime;
+    prev->procTime = procTime;
+    prev->valid = 1;
 
     if (sysDelta == 0) return 0.0;
     return ((double)procDelta / (double)sysDelta) * 100.0;
 }
 
+// The previous sample is shared by every caller, so this is only meaningful when the same
+// process is queried repeatedly (single snapshots, JSON calls and the monitoring thread).
+// ReSharper disable once CppParameterMayBeConst
+double get_cpu_usage(HANDLE hProcess) {
+    static CpuTimes last = {0};
+    return cpu_usage_since(hProcess, &last);
+}
+
 void build_metrics_json(char *buf, const size_t buflen, const DWORD pid, const DWORD metrics,
                         const size_t ws, const size_t priv, const size_t pf, const DWORD handles, const DWORD threads,
                         const double cpu, const unsigned long long io_r, const unsigned long long io_w) {
@@ -213,10 +245,14 @@ int end_metrics_collection(const DWORD pid, const DWORD metrics, char *json_buf,
     return 1;
 }
 
-__declspec(dllexport)
-int get_metrics_json(const DWORD pid, const DWORD metrics, char *json_buf, const size_t json_buflen) {
-    if (!json_buf || json_buflen == 0) return 0;
-
+// Fill a snapshot with the current metrics of a process, returns 0 on failure
+// Collect a snapshot using an existing Toolhelp process snapshot for the thread count,
+// so batch callers only create one system-wide snapshot for many PIDs (each call still
+// walks it from Process32First to find its PID).
+// cpuPrev holds the previous CPU sample of this PID; NULL uses the shared get_cpu_usage() state.
+// With a cpuPrev that has no sample yet, cpu is 0 and METRIC_CPU_USAGE is cleared from snap->metrics.
+static int collect_snapshot_with(const DWORD pid, const DWORD metrics, MetricsSnapshot *snap, const HANDLE hSnap,
+                                 CpuTimes *cpuPrev) {
     // ReSharper disable once CppLocalVariableMayBeConst
     HANDLE hProcess = OpenProcess(PROCESS_QUERY_INFORMATION | PROCESS_VM_READ, FALSE, pid);
     if (!hProcess) return 0;
@@ -233,8 +269,6 @@ int get_metrics_json(const DWORD pid, const DWORD metrics, char *json_buf, const
     DWORD threadCount = 0;
     PROCESSENTRY32 pe32 = {0};
     pe32.dwSize = sizeof(PROCESSENTRY32);
-    // ReSharper disable once CppLocalVariableMayBeConst
-    HANDLE hSnap = CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0);
     if (hSnap != INVALID_HANDLE_VALUE) {
         if (Process32First(hSnap, &pe32)) {
             do {
@@ -244,35 +278,156 @@ int get_metrics_json(const DWORD pid, const DWORD metrics, char *json_buf, const
                 }
             } while (Process32Next(hSnap, &pe32));
         }
-        CloseHandle(hSnap);
     }
 
     IO_COUNTERS ioCounters = {0};
     GetProcessIoCounters(hProcess, &ioCounters);
 
-    const size_t ws = pmc.WorkingSetSize / 1024;
-    const size_t priv = pmc.PrivateUsage / 1024;
-    const size_t pf = pmc.PagefileUsage / 1024;
-    const double cpu = get_cpu_usage(hProcess);
-    const unsigned long long io_r = ioCounters.ReadTransferCount / 1024;
-    const unsigned long long io_w = ioCounters.WriteTransferCount / 1024;
-
-    build_metrics_json(json_buf, json_buflen, pid, metrics, ws, priv, pf, handleCount, threadCount, cpu, io_r, io_w);
+    memset(snap, 0, sizeof(*snap));
+    snap->pid = pid;
+    snap->metrics = metrics;
+    snap->working_set_kb = pmc.WorkingSetSize / 1024;
+    snap->private_kb = pmc.PrivateUsage / 1024;
+    snap->pagefile_kb = pmc.PagefileUsage / 1024;
+    snap->handles = handleCount;
+    snap->threads = threadCount;
+    if (!cpuPrev) {
+        snap->cpu = get_cpu_usage(hProcess);
+    } else if (cpuPrev->valid) {
+        snap->cpu = cpu_usage_since(hProcess, cpuPrev);
+    } else {
+        cpu_usage_since(hProcess, cpuPrev);
+        snap->metrics &= ~METRIC_CPU_USAGE;
+    }
+    snap->io_read_kb = ioCounters.ReadTransferCount / 1024;
+    snap->io_write_kb = ioCounters.WriteTransferCount / 1024;
 
     CloseHandle(hProcess);
     return 1;
 }
 
+static int collect_snapshot(const DWORD pid, const DWORD metrics, MetricsSnapshot *snap, CpuTimes *cpuPrev) {
+    // ReSharper disable once CppLocalVariableMayBeConst
+    HANDLE hSnap = CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0);
+    const int ok = collect_snapshot_with(pid, metrics, snap, hSnap, cpuPrev);
+    if (hSnap != INVALID_HANDLE_VALUE) CloseHandle(hSnap);
+    return ok;
+}
+
+__declspec(dllexport)
+int get_metrics_json(const DWORD pid, const DWORD metrics, char *json_buf, const size_t json_buflen) {
+    if (!json_buf || json_buflen == 0) return 0;
+
+    MetricsSnapshot snap;
+    if (!collect_snapshot(pid, metrics, &snap, NULL)) return 0;
+
+    build_metrics_json(json_buf, json_buflen, pid, metrics, (size_t)snap.working_set_kb, (size_t)snap.private_kb,
+                       (size_t)snap.pagefile_kb, snap.handles, snap.threads, snap.cpu, snap.io_read_kb,
+                       snap.io_write_kb);
+    return 1;
+}
+
+// Clear the fields that were not requested, so callers never see unrequested values
+static void mask_snapshot(MetricsSnapshot *snap, const DWORD metrics) {
+    if (!(metrics & METRIC_WORKING_SET)) snap->working_set_kb = 0;
+    if (!(metrics & METRIC_PRIVATE_BYTES)) snap->private_kb = 0;
+    if (!(metrics & METRIC_PAGEFILE)) snap->pagefile_kb = 0;
+    if (!(metrics & METRIC_HANDLES)) snap->handles = 0;
+    if (!(metrics & METRIC_THREADS)) snap->threads = 0;
+    if (!(metrics & METRIC_CPU_USAGE)) snap->cpu = 0.0;
+    if (!(metrics & METRIC_IO)) snap->io_read_kb = snap->io_write_kb = 0;
+}
+
+__declspec(dllexport)
+int get_metrics_struct(const DWORD pid, const DWORD metrics, MetricsSnapshot *out) {
+    if (!out) return 0;
+
+    MetricsSnapshot snap;
+    if (!collect_snapshot(pid, metrics, &snap, NULL)) return 0;
+    mask_snapshot(&snap, metrics);
+
+    *out = snap;
+    return 1;
+}
+
+// Take up to `count` snapshots, `interval_ms` apart, in a single call.
+// The first snapshot carries no CPU usage (its `metrics` lacks METRIC_CPU_USAGE).
+// Returns the number of snapshots written to `out` (stops early on the first failure).
+__declspec(dllexport)
+int get_metrics_burst(const DWORD pid, const DWORD metrics, MetricsSnapshot *out, const int count,
+                      const DWORD interval_ms) {
+    if (!out || count <= 0) return 0;
+
+    // CPU usage of each sample is measured since the previous one, the first has nothing to compare
+    // against, so it reports cpu = 0 with METRIC_CPU_USAGE cleared
+    CpuTimes cpuPrev = {0};
+    int collected = 0;
+    while (collected < count) {
+        if (!collect_snapshot(pid, metrics, &out[collected], &cpuPrev)) break;
+        mask_snapshot(&out[collected], out[collected].metrics);
+        collected++;
+
+        if (interval_ms > 0 && collected < count) Sleep(interval_ms);
+    }
+    return collected;
+}
+
+// Snapshot several processes in a single call, sharing one Toolhelp snapshot between them.
+// out[i] receives the metrics for pids[i]; entries that could not be collected are zeroed
+// apart from `pid`. If status is not NULL, status[i] is set to 1 on success and 0 on failure.
+// CPU usage needs an earlier sample of the same PID, so it is never reported: cpu is 0 and
+// METRIC_CPU_USAGE is cleared from every entry's `metrics`.
+// Returns the number of successful entries.
+__declspec(dllexport)
+int get_metrics_batch(const DWORD *pids, const int count, const DWORD metrics, MetricsSnapshot *out, int *status) {
+    if (!pids || !out || count <= 0) return 0;
+
+    // ReSharper disable once CppLocalVariableMayBeConst
+    HANDLE hSnap = CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0);
+    int collected = 0;
+    for (int i = 0; i < count; i++) {
+        CpuTimes cpuPrev = {0};
+        const int ok = collect_snapshot_with(pids[i], metrics, &out[i], hSnap, &cpuPrev);
+        if (ok) {
+            mask_snapshot(&out[i], out[i].metrics);
+            collected++;
+        } else {
+            memset(&out[i], 0, sizeof(out[i]));
+            out[i].pid = pids[i];
+        }
+        if (status) status[i] = ok;
+    }
+    if (hSnap != INVALID_HANDLE_VALUE) CloseHandle(hSnap);
+    return collected;
+}
+
 // Thread function to collect metrics at regular intervals
 // ReSharper disable once CppParameterMayBeConst
 DWORD WINAPI MonitoringThreadProc(LPVOID lpParam) {
     MonitoringContext* ctx = (MonitoringContext*)lpParam;
     const DWORD startTime = GetTickCount();
     char buffer[2048];  // Buffer for JSON metrics
+    int batchFilled = 0;
 
     while (ctx->isRunning) {
-        // Collect and send metrics
-        if (get_metrics_json(ctx->pid, ctx->metrics, buffer, sizeof(buffer))) {
+        if (ctx->batchCallbackFn) {
+            // Batched mode: fill the ring front to back and deliver it in one callback
+            if (collect_snapshot(ctx->pid, ctx->metrics, &ctx->ring[batchFilled], NULL)) {
+                mask_snapshot(&ctx->ring[batchFilled], ctx->metrics);
+                if (++batchFilled == ctx->ringCapacity) {
+                    ctx->batchCallbackFn(ctx->ring, batchFilled, ctx->userData);
+                    batchFilled = 0;
+                }
+            }
+        } else if (ctx->ring) {
+            // Buffered mode: write the sample in place, the reader polls ringWritten
+            MetricsSnapshot *slot = &ctx->ring[ctx->ringWritten % ctx->ringCapacity];
+            if (collect_snapshot(ctx->pid, ctx->metrics, slot, NULL)) {
+                mask_snapshot(slot, ctx->metrics);
+                InterlockedIncrement(&ctx->ringWritten);
+            }
+        } else if (get_metrics_json(ctx->pid, ctx->metrics, buffer, sizeof(buffer))) {
+            // Collect and send metrics
             if (ctx->callbackFn) {
                 ctx->callbackFn(buffer, ctx->userData);
             }
@@ -286,14 +441,54 @@ DWORD WINAPI MonitoringThreadProc(LPVOID lpParam) {
             }
         }
 
-        // Sleep for the interval period
-        Sleep(ctx->intervalMs);
+        // Wait for the interval period, returning early when the session is stopped
+        if (WaitForSingleObject(ctx->stopEvent, ctx->intervalMs) == WAIT_OBJECT_0) {
+            break;
+        }
+    }
+
+    // Deliver whatever is left of the last batch
+    if (ctx->batchCallbackFn && batchFilled > 0) {
+        ctx->batchCallbackFn(ctx->ring, batchFilled, ctx->userData);
     }
 
     ctx->isRunning = 0;
     return 0;
 }
 
+// The sessions share g_monitorContext, so a new one may only start once the previous thread is
+// gone; it can outlive isRunning while it delivers its last batch. Returns 0 if it is still alive.
+static int reap_monitoring_thread(void) {
+    if (g_monitorContext.isRunning) return 0;
+    if (g_monitorContext.threadHandle != NULL) {
+        if (WaitForSingleObject(g_monitorContext.threadHandle, 0) == WAIT_TIMEOUT) return 0;
+        CloseHandle(g_monitorContext.threadHandle);
+        g_monitorContext.threadHandle = NULL;
+    }
+    return 1;
+}
+
+// Start MonitoringThreadProc on the already filled g_monitorContext, returns 0 on failure
+static int launch_monitoring_thread(void) {
+    if (g_monitorContext.stopEvent == NULL) {
+        g_monitorContext.stopEvent = CreateEvent(NULL, TRUE, FALSE, NULL);
+        if (g_monitorContext.stopEvent == NULL) {
+            g_monitorContext.isRunning = 0;
+            return 0;
+        }
+    }
+    ResetEvent(g_monitorContext.stopEvent);
+
+    g_monitorContext.threadHandle = CreateThread(NULL, 0, MonitoringThreadProc, &g_monitorContext, 0,
+                                                 &g_monitorContext.threadId);
+    if (g_monitorContext.threadHandle == NULL) {
+        g_monitorContext.isRunning = 0;
+        return 0;
+    }
+
+    return 1;
+}
+
 __declspec(dllexport)
 int start_metrics_monitoring(
     const DWORD pid,
@@ -303,8 +498,8 @@ int start_metrics_monitoring(
     void (*callbackFn)(const char*, void*),
     void* userData) {
 
-    // Don't start if already running
-    if (g_monitorContext.isRunning) {
+    // Don't start if already running, or while the previous session's thread is still exiting
+    if (!reap_monitoring_thread()) {
         return 0;
     }
 
@@ -316,23 +511,83 @@ int start_metrics_monitoring(
     g_monitorContext.isRunning = 1;
     g_monitorContext.callbackFn = callbackFn;
     g_monitorContext.userData = userData;
+    g_monitorContext.ring = NULL;
+    g_monitorContext.ringCapacity = 0;
+    g_monitorContext.ringWritten = 0;
+    g_monitorContext.batchCallbackFn = NULL;
 
     // Create the monitoring thread
-    g_monitorContext.threadHandle = CreateThread(
-        NULL,
-        0,
-        MonitoringThreadProc,
-        &g_monitorContext,
-        0,
-        NULL
-    );
+    return launch_monitoring_thread();
+}
 
-    if (g_monitorContext.threadHandle == NULL) {
-        g_monitorContext.isRunning = 0;
+// Like start_metrics_monitoring, but each sample is written as a MetricsSnapshot into `ring`
+// (capacity entries, reused cyclically) instead of being formatted as JSON for a callback.
+// The ring must stay valid until monitoring has stopped.
+__declspec(dllexport)
+int start_metrics_monitoring_buffered(
+    const DWORD pid,
+    const DWORD metrics,
+    const DWORD intervalMs,
+    const int totalDurationMs,
+    MetricsSnapshot* ring,
+    const int capacity) {
+
+    if (!ring || capacity <= 0 || !reap_monitoring_thread()) {
         return 0;
     }
 
-    return 1;
+    g_monitorContext.pid = pid;
+    g_monitorContext.metrics = metrics;
+    g_monitorContext.intervalMs = intervalMs;
+    g_monitorContext.totalDurationMs = totalDurationMs;
+    g_monitorContext.isRunning = 1;
+    g_monitorContext.callbackFn = NULL;
+    g_monitorContext.userData = NULL;
+    g_monitorContext.ring = ring;
+    g_monitorContext.ringCapacity = capacity;
+    g_monitorContext.ringWritten = 0;
+    g_monitorContext.batchCallbackFn = NULL;
+
+    return launch_monitoring_thread();
+}
+
+// Like start_metrics_monitoring, but samples are collected as MetricsSnapshot structures into
+// `batch` (batchSize entries) and delivered with one callback per full batch, plus a final
+// callback for any partial batch when monitoring ends. `batch` must stay valid until then.
+__declspec(dllexport)
+int start_metrics_monitoring_batched(
+    const DWORD pid,
+    const DWORD metrics,
+    const DWORD intervalMs,
+    const int totalDurationMs,
+    MetricsSnapshot* batch,
+    const int batchSize,
+    void (*batchCallbackFn)(const MetricsSnapshot*, int, void*),
+    void* userData) {
+
+    if (!batch || batchSize <= 0 || !batchCallbackFn || !reap_monitoring_thread()) {
+        return 0;
+    }
+
+    g_monitorContext.pid = pid;
+    g_monitorContext.metrics = metrics;
+    g_monitorContext.intervalMs = intervalMs;
+    g_monitorContext.totalDurationMs = totalDurationMs;
+    g_monitorContext.isRunning = 1;
+    g_monitorContext.callbackFn = NULL;
+    g_monitorContext.userData = userData;
+    g_monitorContext.ring = batch;
+    g_monitorContext.ringCapacity = batchSize;
+    g_monitorContext.ringWritten = 0;
+    g_monitorContext.batchCallbackFn = batchCallbackFn;
+
+    return launch_monitoring_thread();
+}
+
+// Total number of samples written by the current (or last) buffered monitoring session
+__declspec(dllexport)
+LONG get_monitoring_sample_count() {
+    return InterlockedCompareExchange(&g_monitorContext.ringWritten, 0, 0);
 }
 
 __declspec(dllexport)
@@ -341,12 +596,17 @@ int stop_metrics_monitoring() {
         return 0;
     }
 
-    // Signal the thread to stop
+    // Signal the thread to stop and wake it from its interval wait
     g_monitorContext.isRunning = 0;
+    if (g_monitorContext.stopEvent != NULL) {
+        SetEvent(g_monitorContext.stopEvent);
+    }
 
-    // Wait for the thread to exit
-    if (g_monitorContext.threadHandle != NULL) {
-        WaitForSingleObject(g_monitorContext.threadHandle, 5000);  // Wait up to 5 seconds
+    // Wait for the thread to exit, without a timeout: the next session reuses the context and its
+    // buffers. A callback stopping its own session cannot wait for itself, the handle is then
+    // reaped by the next start
+    if (g_monitorContext.threadHandle != NULL && g_monitorContext.threadId != GetCurrentThreadId()) {
+        WaitForSingleObject(g_monitorContext.threadHandle, INFINITE);
         CloseHandle(g_monitorContext.threadHandle);
         g_monitorContext.threadHandle = NULL;
     }
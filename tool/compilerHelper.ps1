@@ -156,7 +156,7 @@ function CompileDll {
 
     $cmd = @"
 call `"$vcvarsPath`" $Arch
-cl /LD $File /Fo`"$objName`" /link /out:`"$dllPath`"
+cl /LD /O2 /GL $File /Fo`"$objName`" /link /LTCG /out:`"$dllPath`"
 exit /b %errorlevel%
 "@
 
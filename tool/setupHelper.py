@@ -1,121 +1,148 @@
 import os
 import pathlib
 import re
-import shutil
-import subprocess
+import stat
 import sys
 
+# VERSION = "x.y.z" line in pyCTools/__init__.py
+_VERSION_RE = re.compile(r'VERSION\s*=\s*[\'"]([^\'"]*)[\'"]')
+# ANSI colours used by success_finale
+_RESET = "\033[0m"
+_CYAN = "\033[96m"
+# Resolved once at import, before __main__ changes the working directory
+_INIT_PATH = pathlib.Path(__file__).resolve().parent.parent / "pyCTools" / "__init__.py"
+
 
 def get_version() -> str:
     try:
-        here = os.path.abspath(os.path.dirname(__file__))
-        init_path = os.path.join(here, "..", "pyCTools", "__init__.py")
-        version_regex = r'^VERSION\s*=\s*[\'"]([^\'"]*)[\'"]'
-
-        with open(init_path, "r", encoding="utf-8") as f:
-            content = f.read()
-        match = re.search(version_regex, content, re.MULTILINE)
-        if match:
-            return match.group(1)
-        else:
-            sys.exit("[x] Could not find VERSION string in pyCTools/__init__.py")
+        # Stop at the first matching line instead of reading and searching the whole file
+        with open(_INIT_PATH, "r", encoding="utf-8") as f:
+            for line in f:
+                match = _VERSION_RE.match(line)
+                if match:
+                    return match.group(1)
+        sys.exit("[x] Could not find VERSION string in pyCTools/__init__.py")
     except Exception as err:
         sys.exit(f"[x] Error reading version from __init__.py: {err}\n")
 
 
 def success_finale(whl_filename_: str, version_: str):
-    # Complete the setup process and provide instructions on what to do next
-    print("\033[0m\n[*] Completed setup.py execution.")
+    # Complete the setup process and provide instructions on what to do next, written in one go
+    lines = [f"{_RESET}\n[*] Completed setup.py execution."]
     if not os.path.isfile("dist/rawBinaryZipped/bin.zip"):
-        print(
+        lines.append(
             "        Suggested action: Run 'distributionHelper.ps1' to create the distribution package for github releases."
         )
-    print(
-        "        Suggested action: Execute the following to test in VENV:\n\033[96m"
+    lines += [
+        f"        Suggested action: Execute the following to test in VENV:\n{_CYAN}"
         "                python -m venv dist/venv_test\n"
         "                dist\\venv_test\\Scripts\\Activate.ps1\n"
         "                python -m pip install --upgrade pip\n"
         f"                pip install dist/wheels/{whl_filename_}\n"
         "                # Do whatever you want here and run any script that uses the library\n"
         "                deactivate\n"
-        "                Remove-Item -Recurse -Force dist\\venv_test\n\033[0m"
-    )
+        f"                Remove-Item -Recurse -Force dist\\venv_test\n{_RESET}",
+        "[*] For local installation, run:",
+        f"        {_CYAN}cd ..{_RESET}",
+        f"        {_CYAN}python -m pip install dist/wheels/{whl_filename_}{_RESET}",
+        "[*] If you place the WHL file on the GitHub releases page, users can download it and install it with:",
+        f"        {_CYAN}pip install https://github.com/DefinetlyNotAI/PyCTools/releases/download/{version_}/{whl_filename_}{_RESET}",
+        f"        > Assuming the version[{version_}] entered earlier is the exact same as the tag release.\n",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def _find_wheels(dist_dir: str, package_name: str) -> list:
+    # One scandir pass, on Windows DirEntry.stat() reuses the metadata read during enumeration.
+    # Case-insensitive like glob on Windows, the wheel is named pyCTools-* but looked up as pyctools-*
+    # An empty package_name matches every wheel
+    prefix = f"{package_name}-".lower() if package_name else ""
+    try:
+        with os.scandir(dist_dir) as entries:
+            return [e for e in entries
+                    if e.name.lower().startswith(prefix) and e.name.lower().endswith(".whl") and e.is_file()]
+    except FileNotFoundError:
+        return []
 
-    print("[*] For local installation, run:")
-    print(f"        \033[96mcd ..\033[0m")
-    print(f"        \033[96mpython -m pip install dist/wheels/{whl_filename_}\033[0m")
-    print("[*] If you place the WHL file on the GitHub releases page, users can download it and install it with:")
-    print(
-        f"        \033[96mpip install https://github.com/DefinetlyNotAI/PyCTools/releases/download/{version_}/{whl_filename_}\033[0m"
-    )
-    print(f"        > Assuming the version[{version_}] entered earlier is the exact same as the tag release.\n")
+
+def needs_rebuild(dist_dir: str, package_name: str) -> bool:
+    # Rebuild unless the newest wheel is younger than every file that goes into it
+    wheel_files = _find_wheels(dist_dir, package_name)
+    if not wheel_files:
+        return True
+    wheel_mtime = max(e.stat().st_mtime for e in wheel_files)
+    sources = [pathlib.Path("setup.py")]
+    sources += [p for p in pathlib.Path("pyCTools").rglob("*") if p.is_file() and "__pycache__" not in p.parts]
+    return any(p.stat().st_mtime > wheel_mtime for p in sources)
 
 
 def get_latest_wheel(dist_dir: str, package_name: str) -> pathlib.Path:
-    dist_path = pathlib.Path(dist_dir)
     pattern = f"{package_name}-*.whl"
-    wheel_files = sorted(
-        dist_path.glob(pattern),
-        key=lambda p: p.stat().st_mtime,
-        reverse=True
-    )
+    wheel_files = _find_wheels(dist_dir, package_name)
     if not wheel_files:
         sys.exit(f"[x] No wheel files matching '{pattern}' found in {dist_dir}??\n")
 
     if len(wheel_files) != 1:
         print("[*] Multiple wheel files found - selecting the most recent one\n")
     print(f"[*] Found wheel file successfully\n")
-    return wheel_files[0]
+    # Only the newest is needed, a single pass is enough
+    return pathlib.Path(max(wheel_files, key=lambda e: e.stat().st_mtime).path)
+
+
+def _rmtree_if_dir(path) -> bool:
+    import shutil  # Only needed when cleaning, keeps get_version() imports light
+
+    # One lstat probe instead of exists() + is_dir(); a missing path is simply nothing to remove
+    try:
+        if not stat.S_ISDIR(os.lstat(path).st_mode):
+            return False
+    except FileNotFoundError:
+        return False
+    shutil.rmtree(path)
+    return True
 
 
 def cleanup():
-    # Remove ./pyCTools.egg-info/
-    egg_info = pathlib.Path('./pyCTools.egg-info')
-    if egg_info.exists() and egg_info.is_dir():
-        shutil.rmtree(egg_info)
-        print('[*] Removed ./pyCTools.egg-info/')
-
-    # Remove ./build/
-    build_dir = pathlib.Path('./build')
-    if build_dir.exists() and build_dir.is_dir():
-        shutil.rmtree(build_dir)
-        print('[*] Removed ./build/')
-
-    # Remove ./pyCTools/dist/
-    pyctools_dist = pathlib.Path('./pyCTools/dist')
-    if pyctools_dist.exists() and pyctools_dist.is_dir():
-        shutil.rmtree(pyctools_dist)
-        print('[*] Removed ./pyCTools/dist/')
+    # Remove ./pyCTools.egg-info/, ./build/ and ./pyCTools/dist/
+    for target in ('./pyCTools.egg-info', './build', './pyCTools/dist'):
+        if _rmtree_if_dir(target):
+            print(f'[*] Removed {target}/')
 
     # Ensure ./dist/wheels/ exists
     dist_dir = pathlib.Path('./dist')
     wheels_dir = dist_dir / 'wheels'
     wheels_dir.mkdir(parents=True, exist_ok=True)
 
-    # Move any .whl files in ./dist to ./dist/wheels/
-    for whl_file in dist_dir.glob('*.whl'):
+    # Move any .whl files in ./dist to ./dist/wheels/, matched like get_latest_wheel() does
+    # Both live on the same filesystem, so a plain rename is enough
+    for entry in _find_wheels(str(dist_dir), ""):
+        whl_file = pathlib.Path(entry.path)
         target = wheels_dir / whl_file.name
-        shutil.move(str(whl_file), str(target))
+        os.replace(whl_file, target)
         print(f'[*] Moved {whl_file} to {target}')
 
 
 if __name__ == "__main__":
+    import subprocess
+
     # Change to the script's directory
     os.chdir("..")
-    # Start the setup process live
-    process = subprocess.Popen(
-        [sys.executable, "-m", "build", "--wheel"],
-        stdout=sys.stdout,
-        stderr=sys.stderr,
-    )
-    # Wait for the process to complete, quit if it fails, cleanup either way
-    exit_code = process.wait()
-    cleanup()
-    if exit_code != 0:
-        sys.exit(1)
+    # Skip the build when the last wheel is still up to date, unless --force is given
+    if "--force" in sys.argv[1:] or needs_rebuild("dist/wheels", "pyctools"):
+        # Run the setup process live, wait for it to complete, quit if it fails, cleanup either way
+        result = subprocess.run(
+            [sys.executable, "-m", "build", "--wheel"],
+            stdout=sys.stdout,
+            stderr=sys.stderr,
+        )
+        cleanup()
+        if result.returncode != 0:
+            sys.exit(1)
+    else:
+        print("[*] Wheel is up to date with the sources - skipping build (use --force to rebuild)\n")
 
     # Get the latest wheel file
-    whl_filename = get_latest_wheel("dist/wheels", "pyctools")
-    whl_filename = str(whl_filename).replace("\\", "/")
-    # Print success message and instructions
-    success_finale(whl_filename_=os.path.basename(str(whl_filename).replace("\\", "/")), version_=get_version())
+    whl_path = get_latest_wheel("dist/wheels", "pyctools")
+    # Print success message and instructions, only the file name is needed and it has no separators
+    success_finale(whl_filename_=whl_path.name, version_=get_version())